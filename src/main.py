@@ -3,6 +3,8 @@ import sys
 
 from flask import Flask, send_from_directory, jsonify
 from flask_cors import CORS
+from sqlalchemy import event
+from sqlalchemy.pool import StaticPool
 from src.models.user import db
 from src.routes.user import user_bp
 from src.routes.humanizer import humanizer_bp
@@ -14,22 +16,79 @@ app.config['SECRET_KEY'] = 'asdf#FGSgvasgf$5$WGT'
 # Enable CORS for all routes
 CORS(app)
 
+# Compress large JSON payloads (Brotli preferred, gzip fallback)
+try:
+    from flask_compress import Compress
+except ImportError:  # Compression is optional in dev environments
+    Compress = None
+
+if Compress is not None:
+    app.config['COMPRESS_ALGORITHM'] = ['br', 'gzip']
+    app.config['COMPRESS_MIN_SIZE'] = 1024
+    app.config['COMPRESS_LEVEL'] = 4
+    app.config['COMPRESS_BR_LEVEL'] = 4
+    Compress(app)
+
+# Per-endpoint latency histograms exposed at /metrics; the WSGI wrapper
+# records timings once instead of each route measuring itself
+try:
+    from prometheus_flask_exporter import PrometheusMetrics
+except ImportError:  # Metrics export is optional
+    PrometheusMetrics = None
+
+if PrometheusMetrics is not None:
+    metrics = PrometheusMetrics(app, group_by='endpoint')
+    metrics.info('app_info', 'AI Humanizer backend', version='1.0')
+
 app.register_blueprint(user_bp)
 app.register_blueprint(humanizer_bp)
 app.register_blueprint(analytics_bp)
 
 # uncomment if you need to use database
-app.config['SQLALCHEMY_DATABASE_URI'] = f"sqlite:///{os.path.join(os.path.dirname(__file__), 'database', 'app.db')}"
+_db_path = os.path.join(os.path.dirname(__file__), 'database', 'app.db')
+app.config['SQLALCHEMY_DATABASE_URI'] = f"sqlite:///{_db_path}"
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+# Share one SQLite connection across threads so read-heavy analytics
+# endpoints don't contend with the batch writer
+app.config['SQLALCHEMY_ENGINE_OPTIONS'] = {
+    'poolclass': StaticPool,
+    'connect_args': {'check_same_thread': False, 'timeout': 30}
+}
 db.init_app(app)
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Enable WAL so concurrent readers aren't blocked by the writer."""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA mmap_size=268435456")
+    cursor.execute("PRAGMA cache_size=-65536")
+    cursor.close()
+
 with app.app_context():
-    db.create_all()
+    event.listens_for(db.engine, 'connect')(_set_sqlite_pragmas)
+    # Only build the schema when the database doesn't exist yet, so every
+    # worker boot doesn't re-run DDL against the shared file
+    if not os.path.exists(_db_path) or os.getenv('AUTO_CREATE_DB'):
+        db.create_all()
+        # Under gunicorn --preload this runs in the master before the
+        # fork; drop the StaticPool's single connection so SQLite file
+        # descriptors never cross fork() and each worker opens its own
+        db.engine.dispose()
 
 # API catch-all for unhandled /api routes
 @app.route("/api/<path:path>")
 def api_catch_all(path):
     return jsonify({"error": "API endpoint not found"}), 404
 
+# Manifest of static files built once at startup so serve() does a set
+# lookup instead of a filesystem stat per request
+_static_files = frozenset(
+    os.path.relpath(os.path.join(root, name), app.static_folder)
+    for root, _, names in os.walk(app.static_folder)
+    for name in names
+)
+
 # Serve static files and index.html for all other routes
 @app.route('/')
 @app.route('/<path:path>')
@@ -37,13 +96,26 @@ def serve(path=None):
     if path is None:
         path = ''
 
-    if path != "" and os.path.exists(os.path.join(app.static_folder, path)):
-        return send_from_directory(app.static_folder, path)
-    else:
-        return send_from_directory(app.static_folder, 'index.html')
+    if path != "":
+        # The debug server keeps probing the disk so new files show up
+        # without a restart; production uses the startup manifest
+        if app.debug:
+            known = os.path.exists(os.path.join(app.static_folder, path))
+        else:
+            known = path in _static_files
+        if known:
+            return send_from_directory(app.static_folder, path)
+    return send_from_directory(app.static_folder, 'index.html')
 
 
 if __name__ == '__main__':
-    app.run(host='0.0.0.0', port=5000, debug=True)
+    # Werkzeug dev server only; production runs gunicorn --preload (see
+    # Procfile/wsgi.py) so module-level services are constructed once in
+    # the master and shared with workers via copy-on-write fork
+    app.run(
+        host='0.0.0.0',
+        port=5000,
+        debug=os.getenv('FLASK_DEBUG', '1') == '1'
+    )
 
 
@@ -2,18 +2,258 @@
 Analytics Routes
 Provides endpoints for text analysis, comparison, and batch processing.
 """
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, request, jsonify, Response
+import atexit
+import hashlib
+import math
+import os
+import pickle
+import re
 import time
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+from typing import Any, Dict, Optional
 from ..services.text_analytics_service import TextAnalyticsService
 from ..services.text_comparison_service import TextComparisonService
 from ..services.batch_processing_service import BatchProcessingService
 
+try:
+    import orjson
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+except ImportError:  # Fall back to the stdlib codec
+    import json as _json
+    _json_dumps = lambda obj: _json.dumps(obj).encode()
+    _json_loads = _json.loads
+
 analytics_bp = Blueprint('analytics', __name__)
 
+# Pattern used on the /api/analyze hot path, compiled once at import so
+# requests don't pay re's pattern-cache lookup and hashing
+_WORD_RE = re.compile(r'\b\w+\b', re.ASCII)
+
+# Upper bound on total batch text size accepted by /api/batch
+MAX_BATCH_BYTES = 10 * 1024 * 1024
+
+# Single-thread pool for maintenance work so cleanup requests return
+# immediately instead of walking the batch table inline
+_maint_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix='batch-maint')
+
+def parse_json_body() -> Optional[Dict[str, Any]]:
+    """
+    Decode the request body with orjson (falls back to stdlib json).
+
+    cache=False skips Flask's second copy of the raw body; malformed or
+    non-object payloads come back as None so routes can 400 on them.
+    """
+    raw = request.get_data(cache=False)
+    if not raw:
+        return None
+    try:
+        data = _json_loads(raw)
+    except ValueError:
+        return None
+    return data if isinstance(data, dict) else None
+
+def _stream_json(payload: Dict[str, Any]):
+    """
+    Yield a JSON object one top-level field at a time.
+
+    Large analysis payloads are flushed field-by-field instead of being
+    serialized into one duplicate in-memory buffer, cutting peak memory
+    and time-to-first-byte.
+    """
+    yield b'{'
+    first = True
+    for key, value in payload.items():
+        if not first:
+            yield b','
+        first = False
+        yield _json_dumps(key) + b':' + _json_dumps(value)
+    yield b'}'
+
+def stream_json_response(payload: Dict[str, Any]) -> Response:
+    """Build a chunked application/json response for payload.
+
+    The generator closes only over the already-built payload and never
+    touches request state, so it deliberately skips stream_with_context:
+    keeping the request context alive into async-view teardown is what
+    produced intermittent "Popped wrong request context" failures.
+    """
+    return Response(_stream_json(payload), mimetype='application/json')
+
+class SemanticCache:
+    """
+    Cache for analysis results keyed by text content.
+
+    Two lookup tiers: an exact-match LRU keyed by a blake2b digest of the
+    text (O(1)), and a near-duplicate tier that compares a normalized
+    bag-of-words vector ("centroid") of the incoming text against stored
+    centroids using cosine similarity. Near-duplicate hits (e.g. a UI
+    re-submitting on every keystroke) reuse the cached result when
+    similarity exceeds the threshold. Centroids are persisted to disk so
+    the cache survives restarts; writes are throttled and happen outside
+    the lock so persistence never sits on the request path.
+    """
+
+    # Seconds between best-effort snapshots to disk
+    _SAVE_INTERVAL = 60.0
+
+    def __init__(self, max_entries: int = 4096, max_centroids: int = 512,
+                 similarity_threshold: float = 0.86,
+                 persist_path: Optional[str] = None):
+        self.max_entries = max_entries
+        self.max_centroids = max_centroids
+        self.similarity_threshold = similarity_threshold
+        self.persist_path = persist_path
+        self._exact = OrderedDict()  # digest -> result dict
+        self._centroids = []  # list of (norm_vector_dict, hit_count)
+        self._results = []    # parallel list of result dicts
+        self._lock = Lock()
+        self._dirty = False
+        self._last_save = 0.0
+        self._load()
+        if persist_path:
+            atexit.register(self.flush)
+
+    def get(self, text: str) -> Optional[Dict[str, Any]]:
+        """Return a cached analysis result for text, or None on a miss."""
+        digest = self._digest(text)
+        with self._lock:
+            if digest in self._exact:
+                self._exact.move_to_end(digest)
+                return self._exact[digest]
+
+        vector = self._embed(text)
+        with self._lock:
+            best_index, best_similarity = self._nearest(vector)
+            if best_index is not None and best_similarity >= self.similarity_threshold:
+                return self._results[best_index]
+        return None
+
+    def put(self, text: str, result: Dict[str, Any]) -> None:
+        """Store an analysis result under both exact and centroid tiers."""
+        digest = self._digest(text)
+        vector = self._embed(text)
+        with self._lock:
+            self._exact[digest] = result
+            self._exact.move_to_end(digest)
+            while len(self._exact) > self.max_entries:
+                self._exact.popitem(last=False)
+
+            best_index, best_similarity = self._nearest(vector)
+            if best_index is not None and best_similarity >= self.similarity_threshold:
+                # Update the nearest centroid via running mean
+                centroid, hits = self._centroids[best_index]
+                merged = dict(centroid)
+                for token, weight in vector.items():
+                    merged[token] = (merged.get(token, 0.0) * hits + weight) / (hits + 1)
+                self._centroids[best_index] = (self._normalize(merged), hits + 1)
+                self._results[best_index] = result
+            else:
+                self._centroids.append((vector, 1))
+                self._results.append(result)
+                while len(self._centroids) > self.max_centroids:
+                    self._centroids.pop(0)
+                    self._results.pop(0)
+
+            self._dirty = True
+
+        self._maybe_save()
+
+    @staticmethod
+    def _digest(text: str) -> bytes:
+        return hashlib.blake2b(text.encode()).digest()
+
+    @staticmethod
+    def _embed(text: str) -> Dict[str, float]:
+        """Build a normalized bag-of-words vector for the text."""
+        counts = Counter(_WORD_RE.findall(text.lower()))
+        return SemanticCache._normalize(counts)
+
+    @staticmethod
+    def _normalize(vector: Dict[str, float]) -> Dict[str, float]:
+        norm = math.sqrt(sum(value * value for value in vector.values()))
+        if norm == 0:
+            return {}
+        return {token: value / norm for token, value in vector.items()}
+
+    def _nearest(self, vector: Dict[str, float]):
+        """Find the stored centroid most similar to vector (cosine)."""
+        best_index = None
+        best_similarity = 0.0
+        for index, (centroid, _) in enumerate(self._centroids):
+            # Both vectors are unit-normalized, so the dot product is cosine
+            if len(centroid) < len(vector):
+                smaller, larger = centroid, vector
+            else:
+                smaller, larger = vector, centroid
+            similarity = sum(
+                weight * larger.get(token, 0.0) for token, weight in smaller.items()
+            )
+            if similarity > best_similarity:
+                best_index = index
+                best_similarity = similarity
+        return best_index, best_similarity
+
+    def _load(self) -> None:
+        if not self.persist_path or not os.path.exists(self.persist_path):
+            return
+        try:
+            with open(self.persist_path, 'rb') as f:
+                saved = pickle.load(f)
+            self._centroids = saved.get('centroids', [])
+            self._results = saved.get('results', [])
+        except Exception:
+            # Corrupt or incompatible cache file; start fresh
+            self._centroids = []
+            self._results = []
+
+    def _snapshot_if_dirty(self) -> Optional[Dict[str, Any]]:
+        """Copy the persistable state under the lock, or None if clean."""
+        with self._lock:
+            if not self._dirty:
+                return None
+            self._dirty = False
+            self._last_save = time.monotonic()
+            return {'centroids': list(self._centroids), 'results': list(self._results)}
+
+    def _maybe_save(self) -> None:
+        """Persist at most once per interval; the pickle runs unlocked."""
+        if not self.persist_path:
+            return
+        if time.monotonic() - self._last_save < self._SAVE_INTERVAL:
+            return
+        snapshot = self._snapshot_if_dirty()
+        if snapshot is not None:
+            self._write(snapshot)
+
+    def flush(self) -> None:
+        """Write any unsaved entries; registered to run at shutdown."""
+        if not self.persist_path:
+            return
+        snapshot = self._snapshot_if_dirty()
+        if snapshot is not None:
+            self._write(snapshot)
+
+    def _write(self, snapshot: Dict[str, Any]) -> None:
+        try:
+            with open(self.persist_path, 'wb') as f:
+                pickle.dump(snapshot, f)
+        except Exception:
+            # Persistence is best-effort; never fail a request over it
+            pass
+
 # Initialize services
 text_analytics = TextAnalyticsService()
 text_comparison = TextComparisonService()
 batch_processor = BatchProcessingService()
+analysis_cache = SemanticCache(
+    persist_path=os.path.join(
+        os.path.dirname(os.path.dirname(__file__)), 'database', 'semantic_cache.pkl'
+    )
+)
 
 @analytics_bp.route('/api/analyze', methods=['POST'])
 def analyze_text():
@@ -21,41 +261,52 @@ def analyze_text():
     Analyze text for various metrics including readability, complexity, and AI indicators.
     """
     try:
-        data = request.get_json()
+        data = parse_json_body()
         
         if not data or 'text' not in data:
             return jsonify({"error": "No text provided"}), 400
         
         text = data['text']
-        
-        if not text.strip():
+
+        # isspace() short-circuits on the first non-space char; .strip()
+        # would copy the whole string just to test emptiness
+        if not text or text.isspace():
             return jsonify({"error": "Empty text provided"}), 400
         
-        # Record processing start time
-        start_time = time.time()
-        
-        # Analyze the text
-        analysis_result = text_analytics.analyze_text(text)
-        
-        # Calculate processing time
-        processing_time = (time.time() - start_time) * 1000
-        
-        if analysis_result['success']:
+        # Record processing start time (monotonic, integer nanoseconds)
+        start_ns = time.perf_counter_ns()
+
+        # Check the semantic cache before running full analytics
+        cache_hit = False
+        analysis_result = analysis_cache.get(text)
+        if analysis_result is not None:
+            cache_hit = True
+        else:
+            # Analyze the text
+            analysis_result = text_analytics.analyze_text(text)
+            if analysis_result['success']:
+                analysis_cache.put(text, analysis_result)
+
+        # Calculate processing time once; int math sidesteps float round()
+        processing_time_ms = (time.perf_counter_ns() - start_ns) // 100_000 / 10
+
+        if analysis_result.get('success'):
             response = {
                 "success": True,
                 "text_length": len(text),
-                "processing_time_ms": round(processing_time, 1),
+                "processing_time_ms": processing_time_ms,
+                "cache_hit": cache_hit,
                 "analysis": analysis_result
             }
         else:
             response = {
                 "success": False,
                 "error": analysis_result.get('error', 'Analysis failed'),
-                "processing_time_ms": round(processing_time, 1)
+                "processing_time_ms": processing_time_ms
             }
-        
-        return jsonify(response)
-        
+
+        return stream_json_response(response)
+
     except Exception as e:
         return jsonify({"error": f"Analysis failed: {str(e)}"}), 500
 
@@ -65,7 +316,7 @@ def compare_texts():
     Compare original and humanized texts with detailed analysis.
     """
     try:
-        data = request.get_json()
+        data = parse_json_body()
         
         if not data or 'original' not in data or 'humanized' not in data:
             return jsonify({"error": "Both original and humanized texts are required"}), 400
@@ -73,45 +324,50 @@ def compare_texts():
         original = data['original']
         humanized = data['humanized']
         
-        if not original.strip() or not humanized.strip():
+        if (not original or original.isspace() or
+                not humanized or humanized.isspace()):
             return jsonify({"error": "Both texts must be non-empty"}), 400
         
-        # Record processing start time
-        start_time = time.time()
-        
+        # Record processing start time (monotonic, integer nanoseconds)
+        start_ns = time.perf_counter_ns()
+
         # Compare the texts
         comparison_result = text_comparison.compare_texts(original, humanized)
         
-        # Calculate processing time
-        processing_time = (time.time() - start_time) * 1000
-        
-        if comparison_result['success']:
+        # Calculate processing time once; int math sidesteps float round()
+        processing_time_ms = (time.perf_counter_ns() - start_ns) // 100_000 / 10
+
+        if comparison_result.get('success'):
             response = {
                 "success": True,
                 "original_length": len(original),
                 "humanized_length": len(humanized),
-                "processing_time_ms": round(processing_time, 1),
+                "processing_time_ms": processing_time_ms,
                 "comparison": comparison_result
             }
         else:
             response = {
                 "success": False,
                 "error": comparison_result.get('error', 'Comparison failed'),
-                "processing_time_ms": round(processing_time, 1)
+                "processing_time_ms": processing_time_ms
             }
-        
-        return jsonify(response)
-        
+
+        return stream_json_response(response)
+
     except Exception as e:
         return jsonify({"error": f"Comparison failed: {str(e)}"}), 500
 
 @analytics_bp.route('/api/batch', methods=['POST'])
-def process_batch():
+async def process_batch():
     """
     Process multiple texts in batch with progress tracking.
+
+    Async view: per-text work is fanned out with asyncio.gather over the
+    batch processor's thread pool, so status polls aren't blocked behind a
+    running batch.
     """
     try:
-        data = request.get_json()
+        data = parse_json_body()
         
         if not data or 'texts' not in data:
             return jsonify({"error": "No texts provided"}), 400
@@ -125,21 +381,33 @@ def process_batch():
         
         if not texts:
             return jsonify({"error": "Empty text list provided"}), 400
-        
+
+        # Reject oversized or malformed batches before any worker is spawned
+        if len(texts) > batch_processor.max_batch_size:
+            return jsonify({
+                "error": f"Batch size exceeds {batch_processor.max_batch_size}"
+            }), 413
+
+        if not all(isinstance(t, str) for t in texts):
+            return jsonify({"error": "All items must be strings"}), 400
+
+        if sum(len(t.encode('utf-8', 'ignore')) for t in texts) > MAX_BATCH_BYTES:
+            return jsonify({"error": "Batch payload too large"}), 413
+
         # Validate mode
         if mode not in ['fast', 'balanced', 'aggressive']:
             return jsonify({"error": "Invalid mode. Must be 'fast', 'balanced', or 'aggressive'"}), 400
         
         # Process the batch
-        batch_result = batch_processor.process_batch(texts, mode, batch_id)
-        
-        return jsonify(batch_result)
+        batch_result = await batch_processor.process_batch_async(texts, mode, batch_id)
+
+        return stream_json_response(batch_result)
         
     except Exception as e:
         return jsonify({"error": f"Batch processing failed: {str(e)}"}), 500
 
 @analytics_bp.route('/api/batch/status/<batch_id>', methods=['GET'])
-def get_batch_status(batch_id):
+async def get_batch_status(batch_id):
     """
     Get the status of a batch processing job.
     """
@@ -165,34 +433,79 @@ def get_active_batches():
     except Exception as e:
         return jsonify({"error": f"Failed to get active batches: {str(e)}"}), 500
 
+@analytics_bp.route('/api/batch/stream', methods=['GET'])
+def stream_batch_status():
+    """
+    Server-sent events stream of batch progress.
+
+    Pushes a snapshot of the active batches only when something changed,
+    so the frontend doesn't need to poll /api/batch/active every second.
+    """
+    def generate():
+        last_payload = None
+        while True:
+            try:
+                snapshot = batch_processor.get_active_batches()
+            except Exception as e:
+                yield f"event: error\ndata: {str(e)}\n\n".encode()
+                return
+            payload = _json_dumps(snapshot)
+            if payload != last_payload:
+                last_payload = payload
+                yield b'data: ' + payload + b'\n\n'
+            time.sleep(0.25)
+
+    # No stream_with_context: the generator only reads the module-level
+    # batch processor, never the request
+    return Response(
+        generate(),
+        mimetype='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
+
 @analytics_bp.route('/api/batch/cleanup', methods=['POST'])
 def cleanup_old_batches():
     """
     Clean up old batch processing records.
     """
     try:
-        data = request.get_json() or {}
+        data = parse_json_body() or {}
         max_age_hours = data.get('max_age_hours', 24)
         
         # Validate max_age_hours
         if not isinstance(max_age_hours, (int, float)) or max_age_hours <= 0:
             return jsonify({"error": "max_age_hours must be a positive number"}), 400
         
-        batch_processor.cleanup_old_batches(max_age_hours)
-        
+        # Fire-and-forget: the walk over active_batches happens on the
+        # maintenance thread while the client gets a 202 right away
+        _maint_pool.submit(batch_processor.cleanup_old_batches, max_age_hours)
+
         return jsonify({
             "success": True,
-            "message": f"Cleaned up batches older than {max_age_hours} hours"
-        })
+            "message": f"Cleanup of batches older than {max_age_hours} hours scheduled"
+        }), 202
         
     except Exception as e:
         return jsonify({"error": f"Cleanup failed: {str(e)}"}), 500
 
+# Cached health payload so frequent liveness probes don't re-run a full
+# analytics pass each time: (timestamp, payload)
+_health_cache = (0.0, None)
+_HEALTH_CACHE_TTL = 10.0
+
 @analytics_bp.route('/api/analytics/health', methods=['GET'])
 def analytics_health_check():
     """
     Health check for analytics services.
+
+    The probe result is cached for a short TTL; probes inside the window
+    get the previous payload without re-running the service tests.
     """
+    global _health_cache
+    cached_at, cached_payload = _health_cache
+    if cached_payload is not None and time.time() - cached_at < _HEALTH_CACHE_TTL:
+        return jsonify(cached_payload)
+
     try:
         # Test each service
         services_status = {}
@@ -222,12 +535,14 @@ def analytics_health_check():
             status == 'healthy' for status in services_status.values()
         ) else 'degraded'
         
-        return jsonify({
+        payload = {
             "status": overall_status,
             "service": "AI Humanizer Analytics",
             "services": services_status,
             "timestamp": time.time()
-        })
+        }
+        _health_cache = (time.time(), payload)
+        return jsonify(payload)
         
     except Exception as e:
         return jsonify({
@@ -255,7 +570,7 @@ def get_analytics_stats():
             },
             "batch_processor_config": {
                 "max_workers": batch_processor.max_workers,
-                "max_batch_size": 50
+                "max_batch_size": batch_processor.max_batch_size
             }
         }
         
@@ -4,48 +4,140 @@ Provides additional sophisticated humanization algorithms and techniques.
 """
 import random
 import re
+from itertools import islice
 from typing import Dict, List, Tuple, Any
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Patterns shared by the sentence-level passes, compiled once at import
+# instead of per call through re's cache. The boundary pattern is a plain
+# character class, so the engine scans it in linear time with no
+# backtracking, and the pipeline invokes it exactly once per text.
+_SENT_SPLIT_RE = re.compile(r'[.!?]+')
+# Three-item series missing the Oxford comma: "A, B and C"
+_SERIES_RE = re.compile(r'(\w+), (\w+) and (\w+)')
+
+# Multi-keyword triggers folded into single alternation scans, so each
+# sentence is walked once instead of once per keyword
+_DM_TRIGGER_RE = re.compile(r'result|effect|example|instance|but|however')
+_HEDGE_TRIGGER_RE = re.compile(r'\b(?:is|are|will|must|always|never)\b')
+_KEY_TERM_RE = re.compile(r'important|essential|crucial|significant|vital')
+
+# O(1) membership for the gradable-adjective check in the per-word loop
+_GRADABLE_WORDS = frozenset(
+    ['good', 'bad', 'big', 'small', 'fast', 'slow', 'important', 'significant']
+)
+
+# Trigger sets for the structural helpers; frozensets make the per-word
+# checks C-level hash lookups instead of list scans
+_CLAUSE_NOUNS = frozenset(['system', 'method', 'process', 'technology', 'approach'])
+_APPOSITIVE_NOUNS = frozenset(['technology', 'system', 'method', 'approach'])
+_FRONTABLE_PREPOSITIONS = frozenset(['in', 'on', 'at', 'by', 'with', 'through'])
+_INVERSION_ADVERBS = frozenset(['never', 'rarely', 'seldom'])
+_SPLIT_CONJUNCTIONS = (' and ', ' but ', ' or ', ' so ', ' yet ')
+
 class AdvancedHumanizationService:
     """Service for advanced humanization techniques beyond basic vocabulary replacement."""
-    
+
+    # Only the two method-dispatch tables live on instances; everything
+    # else is class data, so slots keep instances to two pointers
+    __slots__ = ('complexity_patterns', 'rhetorical_devices')
+
+    # All configuration lives at class level: the containers are constant
+    # string data shared by every instance, so instantiating the service
+    # allocates nothing beyond the two bound-method tables in __init__.
+
+    # Advanced linguistic patterns for more sophisticated humanization
+    discourse_markers = {
+        'addition': ('furthermore', 'moreover', 'additionally', 'in addition', 'also', 'besides'),
+        'contrast': ('however', 'nevertheless', 'on the other hand', 'conversely', 'in contrast', 'yet'),
+        'cause_effect': ('therefore', 'consequently', 'as a result', 'thus', 'hence', 'accordingly'),
+        'example': ('for instance', 'for example', 'such as', 'namely', 'specifically', 'in particular'),
+        'emphasis': ('indeed', 'certainly', 'undoubtedly', 'clearly', 'obviously', 'definitely'),
+        'sequence': ('first', 'second', 'next', 'then', 'finally', 'subsequently')
+    }
+
+    # Hedging expressions to add uncertainty and human-like hesitation
+    hedging_expressions = (
+        'it seems that', 'it appears that', 'perhaps', 'possibly', 'likely',
+        'it could be argued that', 'one might say', 'to some extent',
+        'in many cases', 'generally speaking', 'broadly speaking',
+        'it is possible that', 'there is a chance that', 'it may be that'
+    )
+
+    # Intensifiers and downtoners for more nuanced expression
+    intensifiers = ('extremely', 'highly', 'remarkably', 'exceptionally', 'particularly', 'especially')
+    downtoners = ('somewhat', 'rather', 'quite', 'fairly', 'relatively', 'moderately')
+
+    # Colloquial expressions for more natural language
+    colloquial_replacements = {
+        'very good': ('excellent', 'outstanding', 'superb', 'fantastic', 'great'),
+        'very bad': ('terrible', 'awful', 'horrible', 'dreadful', 'poor'),
+        'very big': ('huge', 'enormous', 'massive', 'gigantic', 'vast'),
+        'very small': ('tiny', 'minuscule', 'microscopic', 'minute', 'petite'),
+        'very fast': ('rapid', 'swift', 'speedy', 'quick', 'brisk'),
+        'very slow': ('sluggish', 'gradual', 'leisurely', 'unhurried', 'deliberate')
+    }
+
+    # Emotional and subjective language markers
+    subjective_markers = (
+        'I believe', 'in my opinion', 'from my perspective', 'personally',
+        'it strikes me that', 'I feel that', 'my impression is',
+        'as I see it', 'to my mind', 'I would argue that'
+    )
+
+    # Metaphorical and alliterative rewrites keyed by trigger word
+    metaphors = {
+        'process': 'journey',
+        'system': 'ecosystem',
+        'method': 'pathway',
+        'approach': 'strategy',
+        'solution': 'key'
+    }
+    alliterative_pairs = {
+        'significant': 'substantial',
+        'important': 'imperative',
+        'effective': 'efficient',
+        'comprehensive': 'complete',
+        'fundamental': 'foundational'
+    }
+
+    # One alternation per rewrite family: the text is walked once and
+    # the callback dispatches on the matched literal, instead of one
+    # full scan per candidate word
+    _colloquial_re = re.compile(
+        r'\b(' + '|'.join(map(re.escape, colloquial_replacements)) + r')\b',
+        re.IGNORECASE
+    )
+    _metaphor_re = re.compile(
+        r'\b(' + '|'.join(map(re.escape, metaphors)) + r')\b',
+        re.IGNORECASE
+    )
+    _alliterative_re = re.compile(
+        r'\b(' + '|'.join(map(re.escape, alliterative_pairs)) + r')\b',
+        re.IGNORECASE
+    )
+
+    # Stable category tuple so the fallback branch doesn't rebuild
+    # list(keys()) per sentence
+    _discourse_categories = tuple(discourse_markers)
+
+    # Pre-capitalized variants so sentence-initial insertion doesn't
+    # allocate a .capitalize() copy per hit
+    _discourse_markers_cap = {
+        category: tuple(m.capitalize() for m in markers)
+        for category, markers in discourse_markers.items()
+    }
+    _hedging_expressions_cap = tuple(h.capitalize() for h in hedging_expressions)
+
+    # Probabilistic passes bail out before scanning the text when their
+    # effective trigger probability is below this
+    _MIN_EFFECTIVE_P = 0.01
+
     def __init__(self):
-        # Advanced linguistic patterns for more sophisticated humanization
-        self.discourse_markers = {
-            'addition': ['furthermore', 'moreover', 'additionally', 'in addition', 'also', 'besides'],
-            'contrast': ['however', 'nevertheless', 'on the other hand', 'conversely', 'in contrast', 'yet'],
-            'cause_effect': ['therefore', 'consequently', 'as a result', 'thus', 'hence', 'accordingly'],
-            'example': ['for instance', 'for example', 'such as', 'namely', 'specifically', 'in particular'],
-            'emphasis': ['indeed', 'certainly', 'undoubtedly', 'clearly', 'obviously', 'definitely'],
-            'sequence': ['first', 'second', 'next', 'then', 'finally', 'subsequently']
-        }
-        
-        # Hedging expressions to add uncertainty and human-like hesitation
-        self.hedging_expressions = [
-            'it seems that', 'it appears that', 'perhaps', 'possibly', 'likely',
-            'it could be argued that', 'one might say', 'to some extent',
-            'in many cases', 'generally speaking', 'broadly speaking',
-            'it is possible that', 'there is a chance that', 'it may be that'
-        ]
-        
-        # Intensifiers and downtoners for more nuanced expression
-        self.intensifiers = ['extremely', 'highly', 'remarkably', 'exceptionally', 'particularly', 'especially']
-        self.downtoners = ['somewhat', 'rather', 'quite', 'fairly', 'relatively', 'moderately']
-        
-        # Colloquial expressions for more natural language
-        self.colloquial_replacements = {
-            'very good': ['excellent', 'outstanding', 'superb', 'fantastic', 'great'],
-            'very bad': ['terrible', 'awful', 'horrible', 'dreadful', 'poor'],
-            'very big': ['huge', 'enormous', 'massive', 'gigantic', 'vast'],
-            'very small': ['tiny', 'minuscule', 'microscopic', 'minute', 'petite'],
-            'very fast': ['rapid', 'swift', 'speedy', 'quick', 'brisk'],
-            'very slow': ['sluggish', 'gradual', 'leisurely', 'unhurried', 'deliberate']
-        }
-        
-        # Sentence complexity patterns
+        # Only the method tables are per instance: they close over bound
+        # methods, which don't exist until the instance does
         self.complexity_patterns = {
             'simple_to_complex': [
                 lambda s: self._add_relative_clause(s),
@@ -58,31 +150,27 @@ class AdvancedHumanizationService:
                 lambda s: self._convert_passive_to_active(s)
             ]
         }
-        
-        # Emotional and subjective language markers
-        self.subjective_markers = [
-            'I believe', 'in my opinion', 'from my perspective', 'personally',
-            'it strikes me that', 'I feel that', 'my impression is',
-            'as I see it', 'to my mind', 'I would argue that'
-        ]
-        
+
         # Rhetorical devices for more engaging text
         self.rhetorical_devices = {
-            'metaphor': ['like a', 'as if', 'resembles', 'mirrors', 'echoes'],
+            'metaphor': ('like a', 'as if', 'resembles', 'mirrors', 'echoes'),
             'alliteration': self._generate_alliterative_phrases,
             'repetition': self._add_strategic_repetition,
             'parallelism': self._create_parallel_structure
         }
 
-    def apply_advanced_humanization(self, text: str, intensity: float, mode: str) -> Dict[str, Any]:
+    def apply_advanced_humanization(self, text: str, intensity: float, mode: str,
+                                    rng=random) -> Dict[str, Any]:
         """
         Apply advanced humanization techniques to text.
-        
+
         Args:
             text: Input text to humanize
             intensity: Humanization intensity (0.0 to 1.0)
             mode: Humanization mode (fast, balanced, aggressive)
-            
+            rng: Random source; callers pass a seeded random.Random for
+                 deterministic rewrites, the module RNG is the default
+
         Returns:
             Dict containing humanized text and applied techniques
         """
@@ -90,16 +178,27 @@ class AdvancedHumanizationService:
             humanized_text = text
             applied_techniques = []
             
-            # Apply techniques based on mode and intensity
-            if mode == 'fast':
-                humanized_text = self._apply_light_humanization(humanized_text, intensity)
-                applied_techniques.extend(['discourse_markers', 'hedging'])
-            elif mode == 'balanced':
-                humanized_text = self._apply_moderate_humanization(humanized_text, intensity)
-                applied_techniques.extend(['discourse_markers', 'hedging', 'complexity_variation', 'subjective_markers'])
-            elif mode == 'aggressive':
-                humanized_text = self._apply_intensive_humanization(humanized_text, intensity)
-                applied_techniques.extend(['all_techniques'])
+            # Apply techniques based on mode and intensity. The text is
+            # tokenized into sentences once; every sentence-level pass
+            # works on that list and the join happens once at the end,
+            # instead of each pass re-splitting and re-joining the text.
+            if mode in ('fast', 'balanced', 'aggressive'):
+                sentences = self._tokenize_sentences(text)
+                if mode == 'fast':
+                    sentences = self._apply_light_humanization(sentences, intensity, rng)
+                    applied_techniques.extend(['discourse_markers', 'hedging'])
+                elif mode == 'balanced':
+                    sentences = self._apply_moderate_humanization(sentences, intensity, rng)
+                    applied_techniques.extend(['discourse_markers', 'hedging', 'complexity_variation', 'subjective_markers'])
+                else:
+                    sentences = self._apply_intensive_humanization(sentences, intensity, rng)
+                    applied_techniques.extend(['all_techniques'])
+                humanized_text = self._join_sentences(sentences)
+
+                # Whole-text passes that don't operate per sentence
+                humanized_text = self._apply_colloquial_replacements(humanized_text, intensity * 0.2, rng)
+                if mode == 'aggressive':
+                    humanized_text = self._add_rhetorical_devices(humanized_text, intensity * 0.5, rng)
             
             return {
                 'success': True,
@@ -119,249 +218,286 @@ class AdvancedHumanizationService:
                 'service': 'advanced_humanization'
             }
 
-    def _apply_light_humanization(self, text: str, intensity: float) -> str:
+    @staticmethod
+    def _tokenize_sentences(text: str) -> List[str]:
+        """Split text into stripped sentences once for the list-based passes."""
+        return [s.strip() for s in _SENT_SPLIT_RE.split(text) if s.strip()]
+
+    @staticmethod
+    def _join_sentences(sentences: List[str]) -> str:
+        """Reassemble the sentence list; the pipeline's single join.
+
+        Each sentence carries its own terminator into the output buffer,
+        so one walk builds the text and a sentence that already ends in
+        a period (e.g. from a compound split) doesn't pick up a second.
+        """
+        out = []
+        for sentence in sentences:
+            if not sentence:
+                continue
+            out.append(sentence if sentence.endswith('.') else sentence + '.')
+            out.append(' ')
+        return ''.join(out).rstrip()
+
+    def _apply_light_humanization(self, sentences: List[str], intensity: float,
+                                  rng=random) -> List[str]:
         """Apply light humanization for fast mode."""
         # Add discourse markers
-        text = self._add_discourse_markers(text, intensity * 0.3)
-        
+        sentences = self._add_discourse_markers(sentences, intensity * 0.3, rng)
+
         # Add hedging expressions
-        text = self._add_hedging_expressions(text, intensity * 0.2)
-        
-        # Light colloquial replacements
-        text = self._apply_colloquial_replacements(text, intensity * 0.2)
-        
-        return text
+        sentences = self._add_hedging_expressions(sentences, intensity * 0.2, rng)
 
-    def _apply_moderate_humanization(self, text: str, intensity: float) -> str:
+        return sentences
+
+    def _apply_moderate_humanization(self, sentences: List[str], intensity: float,
+                                     rng=random) -> List[str]:
         """Apply moderate humanization for balanced mode."""
         # All light techniques with higher intensity
-        text = self._apply_light_humanization(text, intensity)
-        
+        sentences = self._apply_light_humanization(sentences, intensity, rng)
+
         # Add sentence complexity variation
-        text = self._vary_sentence_complexity(text, intensity * 0.4)
-        
+        sentences = self._vary_sentence_complexity(sentences, intensity * 0.4, rng)
+
         # Add subjective markers
-        text = self._add_subjective_markers(text, intensity * 0.3)
-        
+        sentences = self._add_subjective_markers(sentences, intensity * 0.3, rng)
+
         # Add intensifiers and downtoners
-        text = self._add_intensifiers_downtoners(text, intensity * 0.3)
-        
-        return text
+        sentences = self._add_intensifiers_downtoners(sentences, intensity * 0.3, rng)
+
+        return sentences
 
-    def _apply_intensive_humanization(self, text: str, intensity: float) -> str:
+    def _apply_intensive_humanization(self, sentences: List[str], intensity: float,
+                                      rng=random) -> List[str]:
         """Apply intensive humanization for aggressive mode."""
         # All moderate techniques with maximum intensity
-        text = self._apply_moderate_humanization(text, intensity)
-        
-        # Add rhetorical devices
-        text = self._add_rhetorical_devices(text, intensity * 0.5)
-        
+        sentences = self._apply_moderate_humanization(sentences, intensity, rng)
+
         # Advanced sentence restructuring
-        text = self._advanced_sentence_restructuring(text, intensity * 0.6)
-        
+        sentences = self._advanced_sentence_restructuring(sentences, intensity * 0.6, rng)
+
         # Add emotional language
-        text = self._add_emotional_language(text, intensity * 0.4)
-        
-        return text
+        sentences = self._add_emotional_language(sentences, intensity * 0.4, rng)
 
-    def _add_discourse_markers(self, text: str, intensity: float) -> str:
+        return sentences
+
+    def _add_discourse_markers(self, sentences: List[str], intensity: float,
+                               rng=random) -> List[str]:
         """Add discourse markers to improve text flow."""
-        sentences = re.split(r'[.!?]+', text)
-        modified_sentences = []
-        
-        for i, sentence in enumerate(sentences):
-            sentence = sentence.strip()
-            if not sentence:
-                continue
-                
-            if random.random() < intensity and i > 0:
-                # Choose appropriate discourse marker based on context
-                if 'result' in sentence.lower() or 'effect' in sentence.lower():
-                    marker = random.choice(self.discourse_markers['cause_effect'])
-                elif 'example' in sentence.lower() or 'instance' in sentence.lower():
-                    marker = random.choice(self.discourse_markers['example'])
-                elif 'but' in sentence.lower() or 'however' in sentence.lower():
-                    marker = random.choice(self.discourse_markers['contrast'])
+        if not sentences:
+            return sentences
+        # The first sentence never takes a marker; carrying it over and
+        # iterating the tail drops the per-sentence index check
+        modified_sentences = [sentences[0]]
+        rand = rng.random
+        choice = rng.choice
+        
+        for sentence in islice(sentences, 1, None):
+            if rand() < intensity:
+                # Choose appropriate discourse marker based on context;
+                # one scan collects every trigger, then category priority
+                # (cause/effect > example > contrast) decides
+                triggers = set(_DM_TRIGGER_RE.findall(sentence.lower()))
+                if triggers & {'result', 'effect'}:
+                    marker = choice(self._discourse_markers_cap['cause_effect'])
+                elif triggers & {'example', 'instance'}:
+                    marker = choice(self._discourse_markers_cap['example'])
+                elif triggers & {'but', 'however'}:
+                    marker = choice(self._discourse_markers_cap['contrast'])
                 else:
-                    category = random.choice(list(self.discourse_markers.keys()))
-                    marker = random.choice(self.discourse_markers[category])
+                    category = choice(self._discourse_categories)
+                    marker = choice(self._discourse_markers_cap[category])
                 
-                sentence = f"{marker.capitalize()}, {sentence.lower()}"
+                # Lowering just the first character keeps proper nouns
+                # intact instead of mangling the whole sentence
+                sentence = f"{marker}, {sentence[:1].lower()}{sentence[1:]}"
             
             modified_sentences.append(sentence)
         
-        return '. '.join(modified_sentences) + '.'
+        return modified_sentences
 
-    def _add_hedging_expressions(self, text: str, intensity: float) -> str:
+    def _add_hedging_expressions(self, sentences: List[str], intensity: float,
+                                 rng=random) -> List[str]:
         """Add hedging expressions to make text less definitive."""
-        sentences = text.split('. ')
         modified_sentences = []
-        
+        rand = rng.random
+
         for sentence in sentences:
-            if random.random() < intensity:
-                # Look for definitive statements to hedge
-                if any(word in sentence.lower() for word in ['is', 'are', 'will', 'must', 'always', 'never']):
-                    hedge = random.choice(self.hedging_expressions)
-                    
+            if rand() < intensity:
+                # Look for definitive statements to hedge; one lowercase
+                # copy serves the trigger search and both rewrites
+                lowered = sentence.lower()
+                if _HEDGE_TRIGGER_RE.search(lowered):
                     # Insert hedge appropriately
-                    if sentence.lower().startswith(('this', 'that', 'these', 'those', 'the')):
-                        sentence = f"{hedge.capitalize()}, {sentence.lower()}"
+                    if lowered.startswith(('this', 'that', 'these', 'those', 'the')):
+                        hedge = rng.choice(self._hedging_expressions_cap)
+                        sentence = f"{hedge}, {sentence[:1].lower()}{sentence[1:]}"
                     else:
                         words = sentence.split()
                         if len(words) > 3:
-                            insert_pos = random.randint(1, min(3, len(words) - 1))
+                            hedge = rng.choice(self.hedging_expressions)
+                            insert_pos = rng.randint(1, min(3, len(words) - 1))
                             words.insert(insert_pos, hedge)
                             sentence = ' '.join(words)
             
             modified_sentences.append(sentence)
         
-        return '. '.join(modified_sentences)
+        return modified_sentences
 
-    def _apply_colloquial_replacements(self, text: str, intensity: float) -> str:
+    def _apply_colloquial_replacements(self, text: str, intensity: float,
+                                       rng=random) -> str:
         """Replace formal expressions with more colloquial ones."""
-        for formal, colloquial_list in self.colloquial_replacements.items():
-            if formal in text.lower() and random.random() < intensity:
-                replacement = random.choice(colloquial_list)
-                text = re.sub(re.escape(formal), replacement, text, flags=re.IGNORECASE)
+        def swap(match):
+            if rng.random() < intensity:
+                return rng.choice(self.colloquial_replacements[match.group(1).lower()])
+            return match.group(0)
         
-        return text
+        return self._colloquial_re.sub(swap, text)
 
-    def _vary_sentence_complexity(self, text: str, intensity: float) -> str:
+    def _vary_sentence_complexity(self, sentences: List[str], intensity: float,
+                                  rng=random) -> List[str]:
         """Vary sentence complexity to increase burstiness."""
-        sentences = re.split(r'[.!?]+', text)
         modified_sentences = []
-        
+        rand = rng.random
+
         for sentence in sentences:
-            sentence = sentence.strip()
-            if not sentence:
-                continue
-            
             word_count = len(sentence.split())
-            
-            if random.random() < intensity:
+
+            if rand() < intensity:
                 if word_count < 8:  # Simple sentence - make more complex
-                    if random.random() < 0.5:
-                        sentence = self._add_relative_clause(sentence)
+                    if rand() < 0.5:
+                        sentence = self._add_relative_clause(sentence, rng)
                     else:
-                        sentence = self._add_participial_phrase(sentence)
+                        sentence = self._add_participial_phrase(sentence, rng)
                 elif word_count > 20:  # Complex sentence - simplify
                     sentence = self._split_compound_sentence(sentence)
             
             modified_sentences.append(sentence)
         
-        return '. '.join([s for s in modified_sentences if s]) + '.'
+        return modified_sentences
 
-    def _add_subjective_markers(self, text: str, intensity: float) -> str:
+    def _add_subjective_markers(self, sentences: List[str], intensity: float,
+                                rng=random) -> List[str]:
         """Add subjective markers to make text more personal."""
-        sentences = text.split('. ')
-        modified_sentences = []
-        
-        for i, sentence in enumerate(sentences):
-            if random.random() < intensity and i > 0:
-                marker = random.choice(self.subjective_markers)
-                sentence = f"{marker}, {sentence.lower()}"
+        if not sentences:
+            return sentences
+        modified_sentences = [sentences[0]]
+        rand = rng.random
+
+        for sentence in islice(sentences, 1, None):
+            if rand() < intensity:
+                marker = rng.choice(self.subjective_markers)
+                sentence = f"{marker}, {sentence[:1].lower()}{sentence[1:]}"
             
             modified_sentences.append(sentence)
         
-        return '. '.join(modified_sentences)
+        return modified_sentences
 
-    def _add_intensifiers_downtoners(self, text: str, intensity: float) -> str:
+    def _add_intensifiers_downtoners(self, sentences: List[str], intensity: float,
+                                     rng=random) -> List[str]:
         """Add intensifiers and downtoners for more nuanced expression."""
-        words = text.split()
-        modified_words = []
-        
-        for i, word in enumerate(words):
-            if word.lower() in ['good', 'bad', 'big', 'small', 'fast', 'slow', 'important', 'significant']:
-                if random.random() < intensity:
-                    if random.random() < 0.5:
-                        modifier = random.choice(self.intensifiers)
+        modified_sentences = []
+        rand = rng.random
+
+        for sentence in sentences:
+            modified_words = []
+            for word in sentence.split():
+                if word.lower() in _GRADABLE_WORDS and rand() < intensity:
+                    if rand() < 0.5:
+                        modifier = rng.choice(self.intensifiers)
                     else:
-                        modifier = random.choice(self.downtoners)
+                        modifier = rng.choice(self.downtoners)
                     modified_words.extend([modifier, word])
                 else:
                     modified_words.append(word)
-            else:
-                modified_words.append(word)
+            modified_sentences.append(' '.join(modified_words))
         
-        return ' '.join(modified_words)
+        return modified_sentences
 
-    def _add_rhetorical_devices(self, text: str, intensity: float) -> str:
+    def _add_rhetorical_devices(self, text: str, intensity: float,
+                                rng=random) -> str:
         """Add rhetorical devices for more engaging text."""
-        if random.random() < intensity * 0.3:
+        # Both devices are full-text scans; skip them outright when the
+        # gates can't realistically fire
+        if intensity * 0.3 < self._MIN_EFFECTIVE_P:
+            return text
+
+        if rng.random() < intensity * 0.3:
             # Add metaphorical language
-            text = self._add_metaphorical_language(text)
-        
-        if random.random() < intensity * 0.2:
+            text = self._add_metaphorical_language(text, rng)
+
+        if rng.random() < intensity * 0.2:
             # Add strategic repetition
             text = self._add_strategic_repetition(text)
         
         return text
 
-    def _advanced_sentence_restructuring(self, text: str, intensity: float) -> str:
+    def _advanced_sentence_restructuring(self, sentences: List[str], intensity: float,
+                                         rng=random) -> List[str]:
         """Apply advanced sentence restructuring techniques."""
-        sentences = re.split(r'[.!?]+', text)
         modified_sentences = []
+        rand = rng.random
         
         for sentence in sentences:
-            sentence = sentence.strip()
-            if not sentence:
-                continue
-            
-            if random.random() < intensity:
+            if rand() < intensity:
                 # Apply various restructuring techniques
-                if random.random() < 0.3:
+                if rand() < 0.3:
                     sentence = self._fronting_technique(sentence)
-                elif random.random() < 0.3:
+                elif rand() < 0.3:
                     sentence = self._clefting_technique(sentence)
-                elif random.random() < 0.3:
+                elif rand() < 0.3:
                     sentence = self._inversion_technique(sentence)
             
             modified_sentences.append(sentence)
         
-        return '. '.join([s for s in modified_sentences if s]) + '.'
+        return modified_sentences
 
-    def _add_emotional_language(self, text: str, intensity: float) -> str:
+    def _add_emotional_language(self, sentences: List[str], intensity: float,
+                                rng=random) -> List[str]:
         """Add emotional language to make text more engaging."""
-        emotional_adjectives = ['fascinating', 'intriguing', 'remarkable', 'surprising', 'compelling', 'striking']
-        
-        sentences = text.split('. ')
+        if intensity * 0.3 < self._MIN_EFFECTIVE_P:
+            return sentences
+
+        emotional_adjectives = ('fascinating', 'intriguing', 'remarkable', 'surprising', 'compelling', 'striking')
+
         modified_sentences = []
-        
+        rand = rng.random
+
         for sentence in sentences:
-            if random.random() < intensity * 0.3:
+            if rand() < intensity * 0.3:
                 # Add emotional adjectives
                 words = sentence.split()
                 if len(words) > 3:
-                    adj = random.choice(emotional_adjectives)
-                    insert_pos = random.randint(1, min(3, len(words) - 1))
+                    adj = rng.choice(emotional_adjectives)
+                    insert_pos = rng.randint(1, min(3, len(words) - 1))
                     words.insert(insert_pos, adj)
                     sentence = ' '.join(words)
             
             modified_sentences.append(sentence)
         
-        return '. '.join(modified_sentences)
+        return modified_sentences
 
     # Helper methods for specific transformations
-    def _add_relative_clause(self, sentence: str) -> str:
+    def _add_relative_clause(self, sentence: str, rng=random) -> str:
         """Add a relative clause to make sentence more complex."""
         words = sentence.split()
         if len(words) > 4:
             # Find a noun to attach relative clause to
             for i, word in enumerate(words):
-                if word.lower() in ['system', 'method', 'process', 'technology', 'approach']:
+                if word.lower() in _CLAUSE_NOUNS:
                     relative_clauses = [
                         'which is essential',
                         'that proves effective',
                         'which demonstrates value',
                         'that shows promise'
                     ]
-                    clause = random.choice(relative_clauses)
+                    clause = rng.choice(relative_clauses)
                     words.insert(i + 1, f", {clause},")
                     break
         
         return ' '.join(words)
 
-    def _add_participial_phrase(self, sentence: str) -> str:
+    def _add_participial_phrase(self, sentence: str, rng=random) -> str:
         """Add a participial phrase to increase complexity."""
         participial_phrases = [
             'Building on this foundation',
@@ -369,14 +505,14 @@ class AdvancedHumanizationService:
             'Taking this into account',
             'Recognizing the importance'
         ]
-        
-        if random.random() < 0.5:
-            phrase = random.choice(participial_phrases)
+
+        if rng.random() < 0.5:
+            phrase = rng.choice(participial_phrases)
             return f"{phrase}, {sentence.lower()}"
         
         return sentence
 
-    def _add_appositive(self, sentence: str) -> str:
+    def _add_appositive(self, sentence: str, rng=random) -> str:
         """Add an appositive for additional information."""
         words = sentence.split()
         if len(words) > 5:
@@ -386,10 +522,10 @@ class AdvancedHumanizationService:
                 'a key component',
                 'a vital aspect'
             ]
-            
+
             for i, word in enumerate(words):
-                if word.lower() in ['technology', 'system', 'method', 'approach']:
-                    appositive = random.choice(appositives)
+                if word.lower() in _APPOSITIVE_NOUNS:
+                    appositive = rng.choice(appositives)
                     words.insert(i + 1, f", {appositive},")
                     break
         
@@ -398,11 +534,9 @@ class AdvancedHumanizationService:
     def _split_compound_sentence(self, sentence: str) -> str:
         """Split compound sentences into simpler ones."""
         # Look for coordinating conjunctions
-        conjunctions = ['and', 'but', 'or', 'so', 'yet']
-        
-        for conj in conjunctions:
-            if f' {conj} ' in sentence:
-                parts = sentence.split(f' {conj} ', 1)
+        for conj in _SPLIT_CONJUNCTIONS:
+            if conj in sentence:
+                parts = sentence.split(conj, 1)
                 if len(parts) == 2:
                     return f"{parts[0].strip()}. {parts[1].strip().capitalize()}"
         
@@ -414,7 +548,7 @@ class AdvancedHumanizationService:
         if len(words) > 6:
             # Look for prepositional phrases to front
             for i, word in enumerate(words):
-                if word.lower() in ['in', 'on', 'at', 'by', 'with', 'through']:
+                if word.lower() in _FRONTABLE_PREPOSITIONS:
                     if i + 2 < len(words):
                         fronted = ' '.join(words[i:i+3])
                         remaining = ' '.join(words[:i] + words[i+3:])
@@ -433,10 +567,11 @@ class AdvancedHumanizationService:
 
     def _inversion_technique(self, sentence: str) -> str:
         """Apply inversion for stylistic effect."""
-        if 'never' in sentence.lower() or 'rarely' in sentence.lower():
+        lowered = sentence.lower()
+        if 'never' in lowered or 'rarely' in lowered:
             words = sentence.split()
             for i, word in enumerate(words):
-                if word.lower() in ['never', 'rarely', 'seldom']:
+                if word.lower() in _INVERSION_ADVERBS:
                     if i + 2 < len(words):
                         # Simple inversion
                         inverted = f"{word.capitalize()} {words[i+2]} {words[i+1]} {' '.join(words[i+3:])}"
@@ -444,59 +579,47 @@ class AdvancedHumanizationService:
         
         return sentence
 
-    def _add_metaphorical_language(self, text: str) -> str:
+    def _add_metaphorical_language(self, text: str, rng=random) -> str:
         """Add metaphorical expressions."""
-        metaphors = {
-            'process': 'journey',
-            'system': 'ecosystem',
-            'method': 'pathway',
-            'approach': 'strategy',
-            'solution': 'key'
-        }
-        
-        for literal, metaphor in metaphors.items():
-            if literal in text.lower() and random.random() < 0.3:
-                text = re.sub(rf'\b{literal}\b', metaphor, text, flags=re.IGNORECASE)
+        def swap(match):
+            if rng.random() < 0.3:
+                return self.metaphors[match.group(1).lower()]
+            return match.group(0)
         
-        return text
+        return self._metaphor_re.sub(swap, text)
 
     def _add_strategic_repetition(self, text: str) -> str:
         """Add strategic repetition for emphasis."""
         sentences = text.split('. ')
         if len(sentences) > 2:
-            # Find key terms to repeat
-            key_terms = ['important', 'essential', 'crucial', 'significant', 'vital']
-            
-            for term in key_terms:
-                if term in text.lower():
+            # One scan finds every key term; the original priority order
+            # still picks which one gets the emphasis
+            found = set(_KEY_TERM_RE.findall(text.lower()))
+            for term in ('important', 'essential', 'crucial', 'significant', 'vital'):
+                if term in found:
                     # Add emphasis through repetition
                     text = text.replace(term, f"{term}, truly {term}")
                     break
         
         return text
 
-    def _generate_alliterative_phrases(self, text: str) -> str:
+    def _generate_alliterative_phrases(self, text: str, rng=random) -> str:
         """Generate alliterative phrases where appropriate."""
-        alliterative_pairs = {
-            'significant': 'substantial',
-            'important': 'imperative',
-            'effective': 'efficient',
-            'comprehensive': 'complete',
-            'fundamental': 'foundational'
-        }
-        
-        for word, alliterative in alliterative_pairs.items():
-            if word in text.lower() and random.random() < 0.2:
-                text = re.sub(rf'\b{word}\b', f"{word} and {alliterative}", text, flags=re.IGNORECASE)
+        def expand(match):
+            word = match.group(0)
+            if rng.random() < 0.2:
+                return f"{word} and {self.alliterative_pairs[match.group(1).lower()]}"
+            return word
         
-        return text
+        return self._alliterative_re.sub(expand, text)
 
     def _create_parallel_structure(self, text: str) -> str:
         """Create parallel structures for better flow."""
-        # Look for lists or series
+        # Normalize three-item series to the Oxford comma form. The old
+        # pattern matched series that already had it and substituted the
+        # identical string back — a full-text scan that changed nothing.
         if ' and ' in text:
-            # Simple parallelism enhancement
-            text = re.sub(r'(\w+), (\w+), and (\w+)', r'\1, \2, and \3', text)
+            text = _SERIES_RE.sub(r'\1, \2, and \3', text)
         
         return text
 
@@ -2,15 +2,27 @@
 AI-Text-Humanizer.com API Service
 Provides humanization capabilities using the AI-Text-Humanizer.com API.
 """
+import hashlib
 import requests
 import logging
-from typing import Dict, Any, Optional
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+from requests.adapters import HTTPAdapter
+from typing import Dict, Any, List, Optional
+from urllib3.util.retry import Retry
 
 logger = logging.getLogger(__name__)
 
 class AITextHumanizerService:
     """Service for AI-Text-Humanizer.com API integration."""
     
+    __slots__ = ('base_url', 'email', 'password', 'timeout', 'session',
+                 '_auth_fields', '_cache', '_cache_lock')
+    
+    # Bound on the per-service result cache
+    _CACHE_MAX = 1024
+    
     def __init__(self, email: Optional[str] = None, password: Optional[str] = None):
         """
         Initialize the AI-Text-Humanizer service.
@@ -23,6 +35,24 @@ class AITextHumanizerService:
         self.email = email
         self.password = password
         self.timeout = 30
+        # Keep-alive session: reusing the TLS connection saves the
+        # handshake on every call from the humanization pipeline, and the
+        # retry policy absorbs transient upstream 5xx without a failed run
+        self.session = requests.Session()
+        self.session.mount('https://', HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            max_retries=Retry(total=3, backoff_factor=0.3,
+                              status_forcelist=(502, 503, 504))
+        ))
+        # Let the upstream compress the body on the wire
+        self.session.headers['Accept-Encoding'] = 'gzip, br'
+        # Credentials don't change per call; only the text field does
+        self._auth_fields = {'email': email, 'pw': password}
+        # LRU of successful results keyed by text digest: retries and
+        # repeated paragraphs skip the upstream round-trip entirely
+        self._cache = OrderedDict()
+        self._cache_lock = Lock()
         
     def humanize_text(self, text: str) -> Dict[str, Any]:
         """
@@ -42,31 +72,45 @@ class AITextHumanizerService:
                 "service": "ai_text_humanizer"
             }
         
+        cache_key = hashlib.blake2b(text.encode(), digest_size=16).digest()
+        with self._cache_lock:
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                self._cache.move_to_end(cache_key)
+                # Shallow copy so callers mutating the result don't
+                # poison the cached entry
+                return dict(cached)
+        
         try:
-            data = {
-                'email': self.email,
-                'pw': self.password,
-                'text': text
-            }
+            data = dict(self._auth_fields, text=text)
             
-            response = requests.post(
+            response = self.session.post(
                 self.base_url,
                 data=data,
                 timeout=self.timeout
             )
             
             if response.status_code == 200:
-                humanized_text = response.text.strip()
+                # Decode the bytes directly: .text would run charset
+                # autodetection over the whole body, and the API always
+                # answers UTF-8 plain text
+                humanized_text = response.content.decode('utf-8', 'replace').strip()
                 
                 # Basic validation - check if response is not an error message
-                if humanized_text and not humanized_text.lower().startswith('error'):
-                    return {
+                if humanized_text and humanized_text[:5].lower() != 'error':
+                    result = {
                         "success": True,
                         "humanized_text": humanized_text,
                         "original_length": len(text),
                         "humanized_length": len(humanized_text),
                         "service": "ai_text_humanizer"
                     }
+                    with self._cache_lock:
+                        self._cache[cache_key] = result
+                        self._cache.move_to_end(cache_key)
+                        while len(self._cache) > self._CACHE_MAX:
+                            self._cache.popitem(last=False)
+                    return dict(result)
                 else:
                     logger.warning(f"AI-Text-Humanizer returned error: {humanized_text}")
                     return {
@@ -101,3 +145,22 @@ class AITextHumanizerService:
                 "service": "ai_text_humanizer"
             }
 
+    def humanize_text_many(self, texts: List[str], concurrency: int = 8) -> List[Dict[str, Any]]:
+        """
+        Humanize several texts concurrently over the pooled session.
+
+        Args:
+            texts: Texts to humanize
+            concurrency: Maximum in-flight requests (capped by the
+                adapter's connection pool)
+
+        Returns:
+            Result dicts in the same order as the input texts
+        """
+        if not texts:
+            return []
+        
+        # The calls are independent HTTP round-trips, so threads overlap
+        # their network latency; results keep input order
+        with ThreadPoolExecutor(max_workers=min(concurrency, len(texts))) as pool:
+            return list(pool.map(self.humanize_text, texts))
@@ -2,11 +2,22 @@
 HIX Bypass API Service
 Provides humanization capabilities using the HIX Bypass API.
 """
+import random
 import requests
 import time
 import logging
+from requests.adapters import HTTPAdapter
 from typing import Dict, Any, Optional
 
+try:
+    import orjson
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+except ImportError:  # Fall back to the stdlib codec
+    import json as _json
+    _json_dumps = lambda obj: _json.dumps(obj).encode()
+    _json_loads = _json.loads
+
 logger = logging.getLogger(__name__)
 
 class HIXBypassService:
@@ -22,8 +33,23 @@ class HIXBypassService:
         self.base_url = "https://bypass.hix.ai/api"
         self.api_key = api_key
         self.timeout = 30
-        self.max_retries = 5
-        self.retry_delay = 2  # seconds
+        self.max_retries = 10
+        # Polling backoff: start fast so tasks that finish quickly aren't
+        # stuck behind a fixed 2s sleep, cap the step so slow tasks don't
+        # get hammered. Jitter keeps concurrent pollers from aligning.
+        self.poll_initial_delay = 0.2  # seconds
+        self.poll_max_delay = 2.0  # seconds
+        # Long-poll hint: ask the server to hold the obtain request until
+        # the task finishes (up to this many ms) instead of answering
+        # "pending" immediately. Servers that don't implement it ignore
+        # the parameter and we fall back to the backoff loop.
+        self.poll_wait_ms = 5000
+        # Keep-alive session shared by submit and the obtain polling
+        # loop, so retries don't pay a fresh TLS handshake each attempt
+        self.session = requests.Session()
+        # pool_maxsize covers the batch fan-out so concurrent workers
+        # don't evict each other's keep-alive sockets from the pool
+        self.session.mount('https://', HTTPAdapter(pool_connections=16, pool_maxsize=32))
         
     def humanize_text(self, text: str, mode: str = "Fast") -> Dict[str, Any]:
         """
@@ -95,15 +121,17 @@ class HIXBypassService:
                 'mode': mode
             }
             
-            response = requests.post(
+            # Pre-encoded body: orjson beats the stdlib encoder requests
+            # would use for json=, and Content-Type is already set above
+            response = self.session.post(
                 f"{self.base_url}/submit",
-                json=data,
+                data=_json_dumps(data),
                 headers=headers,
                 timeout=self.timeout
             )
-            
+
             if response.status_code == 200:
-                result = response.json()
+                result = _json_loads(response.content)
                 if result.get('err_code') == 0 and 'data' in result:
                     return result['data'].get('task_id')
                 else:
@@ -120,6 +148,16 @@ class HIXBypassService:
             logger.error(f"HIX Bypass submit unexpected error: {str(e)}")
             return None
     
+    def _poll_delay(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """Backoff before the next obtain poll, honoring Retry-After."""
+        if retry_after:
+            try:
+                return float(retry_after)
+            except ValueError:
+                pass  # Date-formatted Retry-After; fall back to backoff
+        delay = min(self.poll_initial_delay * (2 ** attempt), self.poll_max_delay)
+        return delay + random.uniform(0, 0.1)
+
     def _obtain_result(self, task_id: str) -> Dict[str, Any]:
         """
         Obtain the result of a humanization task from HIX Bypass.
@@ -136,15 +174,17 @@ class HIXBypassService:
         
         for attempt in range(self.max_retries):
             try:
-                response = requests.get(
+                response = self.session.get(
                     f"{self.base_url}/obtain",
-                    params={'task_id': task_id},
+                    params={'task_id': task_id, 'wait_ms': self.poll_wait_ms},
                     headers=headers,
-                    timeout=self.timeout
+                    # Leave headroom for the server-side wait window on
+                    # top of the normal request budget
+                    timeout=self.timeout + self.poll_wait_ms / 1000 + 1
                 )
                 
                 if response.status_code == 200:
-                    result = response.json()
+                    result = _json_loads(response.content)
                     if result.get('err_code') == 0 and 'data' in result:
                         data = result['data']
                         
@@ -163,7 +203,7 @@ class HIXBypassService:
                         elif data.get('subtask_status') in ['processing', 'pending']:
                             # Task still processing, wait and retry
                             logger.info(f"HIX Bypass task {task_id} still processing, attempt {attempt + 1}")
-                            time.sleep(self.retry_delay)
+                            time.sleep(self._poll_delay(attempt, response.headers.get('Retry-After')))
                             continue
                         else:
                             # Task failed or unknown status
@@ -200,7 +240,7 @@ class HIXBypassService:
                         "humanized_text": '',
                         "service": "hix_bypass"
                     }
-                time.sleep(self.retry_delay)
+                time.sleep(self._poll_delay(attempt))
             except Exception as e:
                 logger.error(f"HIX Bypass obtain unexpected error: {str(e)}")
                 return {
@@ -1,13 +1,54 @@
+import hashlib
 import requests
-import json
+from collections import OrderedDict
+from requests.adapters import HTTPAdapter
+from threading import Lock
 from typing import Dict, List, Optional
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # Fall back to the stdlib codec
+    import json as _json
+    _json_loads = _json.loads
+
+# Shared fallback for absent nested fields, so .get() chains stay
+# allocation-free on malformed matches
+_EMPTY = {}
+
 class LanguageToolService:
     """Service for integrating with LanguageTool API for grammar and style checking"""
-    
+
+    # Style suggestions that might change the author's voice
+    _SKIP_CATEGORIES = frozenset({'STYLE', 'REDUNDANCY', 'COLLOQUIALISMS'})
+
+    # LanguageTool category IDs mapped to their statistics bucket;
+    # anything unlisted counts as 'other_issues'
+    _CATEGORY_STATS = {
+        'GRAMMAR': 'grammar_issues',
+        'TYPOS': 'spelling_issues',
+        'SPELLING': 'spelling_issues',
+        'STYLE': 'style_issues',
+        'PUNCTUATION': 'punctuation_issues',
+    }
+
+    # Bound on the memoized check results
+    _CACHE_MAX = 512
+
     def __init__(self, api_url: str = "https://api.languagetool.org/v2/check"):
         self.api_url = api_url
         self.session = requests.Session()
+        self.session.mount('https://', HTTPAdapter(pool_connections=16, pool_maxsize=16))
+        # LRU of parsed check responses keyed by text digest + options:
+        # paragraphs recurring across batches skip the API round trip and
+        # the JSON decode entirely
+        self._cache = OrderedDict()
+        self._cache_lock = Lock()
+
+    def clear_cache(self) -> None:
+        """Drop all memoized check results."""
+        with self._cache_lock:
+            self._cache.clear()
         
     def check_text(self, text: str, language: str = "en-US", level: str = "default") -> Dict:
         """
@@ -21,6 +62,16 @@ class LanguageToolService:
         Returns:
             Dictionary containing matches (issues found) and other metadata
         """
+        cache_key = (hashlib.blake2b(text.encode(), digest_size=16).digest(),
+                     language, level)
+        with self._cache_lock:
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                self._cache.move_to_end(cache_key)
+                # Shallow copy so callers mutating the top level don't
+                # poison the cached entry
+                return dict(cached)
+
         try:
             # Prepare request data
             data = {
@@ -29,16 +80,23 @@ class LanguageToolService:
                 'level': level,
                 'enabledOnly': 'false'
             }
-            
+
             # Make request to LanguageTool API
             response = self.session.post(
                 self.api_url,
                 data=data,
                 timeout=30
             )
-            
+
             if response.status_code == 200:
-                return response.json()
+                result = _json_loads(response.content)
+                # Only successful checks are worth memoizing
+                with self._cache_lock:
+                    self._cache[cache_key] = result
+                    self._cache.move_to_end(cache_key)
+                    while len(self._cache) > self._CACHE_MAX:
+                        self._cache.popitem(last=False)
+                return dict(result)
             else:
                 return {
                     'error': f'LanguageTool API error: {response.status_code}',
@@ -71,50 +129,49 @@ class LanguageToolService:
         if not matches:
             return text
             
-        # Sort matches by offset in reverse order to avoid position shifts
-        sorted_matches = sorted(matches, key=lambda x: x.get('offset', 0), reverse=True)
-        
-        corrected_text = text
-        
+        # Walk the matches in offset order and splice the result together
+        # once at the end: repeated full-string slicing copied the whole
+        # text per applied match, O(matches x len(text))
+        sorted_matches = sorted(matches, key=lambda x: x.get('offset', 0))
+
+        parts = []
+        cursor = 0
+
         for match in sorted_matches:
-            try:
-                offset = match.get('offset', 0)
-                length = match.get('length', 0)
-                replacements = match.get('replacements', [])
-                
-                # Skip if no replacements available
-                if not replacements:
-                    continue
-                
-                # For selective application, only apply high-confidence corrections
-                if not apply_all:
-                    # Skip corrections for certain rule categories that might change meaning
-                    rule_id = match.get('rule', {}).get('id', '')
-                    category_id = match.get('rule', {}).get('category', {}).get('id', '')
-                    
-                    # Skip style suggestions that might change the author's voice
-                    skip_categories = ['STYLE', 'REDUNDANCY', 'COLLOQUIALISMS']
-                    if category_id in skip_categories:
-                        continue
-                    
-                    # Only apply corrections with high confidence
-                    if len(replacements) > 3:  # Too many options, might be uncertain
-                        continue
-                
-                # Apply the first (most likely) replacement
-                replacement = replacements[0].get('value', '')
-                if replacement:
-                    corrected_text = (
-                        corrected_text[:offset] + 
-                        replacement + 
-                        corrected_text[offset + length:]
-                    )
-                    
-            except (KeyError, IndexError, TypeError):
-                # Skip malformed matches
+            offset = match.get('offset', 0)
+            length = match.get('length', 0)
+            replacements = match.get('replacements') or ()
+
+            # Skip if no replacements available
+            if not replacements:
                 continue
-        
-        return corrected_text
+
+            # Skip matches overlapping a correction already applied
+            if offset < cursor:
+                continue
+
+            # For selective application, only apply high-confidence corrections
+            if not apply_all:
+                # Skip corrections for certain rule categories that might change meaning
+                category_id = ((match.get('rule') or _EMPTY).get('category') or _EMPTY).get('id', '')
+
+                # Skip style suggestions that might change the author's voice
+                if category_id in self._SKIP_CATEGORIES:
+                    continue
+
+                # Only apply corrections with high confidence
+                if len(replacements) > 3:  # Too many options, might be uncertain
+                    continue
+
+            # Apply the first (most likely) replacement
+            replacement = (replacements[0] or _EMPTY).get('value', '')
+            if replacement:
+                parts.append(text[cursor:offset])
+                parts.append(replacement)
+                cursor = offset + length
+
+        parts.append(text[cursor:])
+        return ''.join(parts)
     
     def get_writing_statistics(self, matches: List[Dict]) -> Dict:
         """
@@ -136,22 +193,8 @@ class LanguageToolService:
         }
         
         for match in matches:
-            try:
-                category_id = match.get('rule', {}).get('category', {}).get('id', '').upper()
-                
-                if 'GRAMMAR' in category_id:
-                    stats['grammar_issues'] += 1
-                elif 'TYPOS' in category_id or 'SPELLING' in category_id:
-                    stats['spelling_issues'] += 1
-                elif 'STYLE' in category_id:
-                    stats['style_issues'] += 1
-                elif 'PUNCTUATION' in category_id:
-                    stats['punctuation_issues'] += 1
-                else:
-                    stats['other_issues'] += 1
-                    
-            except (KeyError, TypeError):
-                stats['other_issues'] += 1
+            category_id = ((match.get('rule') or _EMPTY).get('category') or _EMPTY).get('id', '').upper()
+            stats[self._CATEGORY_STATS.get(category_id, 'other_issues')] += 1
         
         return stats
     
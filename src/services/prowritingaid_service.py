@@ -1,22 +1,88 @@
+import hashlib
 import requests
 import json
 import time
+from bisect import bisect_right
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from threading import Lock
 from typing import Dict, List, Optional
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+except ImportError:  # Fall back to the stdlib codec
+    _json_dumps = lambda obj: json.dumps(obj).encode()
+    _json_loads = json.loads
+
+# Sentinel between batched texts: the Record Separator symbol framed by
+# newlines never occurs in real prose, so tags can't legitimately span it
+_BATCH_SEP = "\n␞\n"
 
 class ProWritingAidService:
     """Service for integrating with ProWritingAid API for advanced grammar and style checking"""
-    
-    def __init__(self, api_key: Optional[str] = None):
+
+    # Result-poll backoff: geometric from 0.3s capped at 3s, so short
+    # jobs aren't stuck behind a flat sleep and long jobs poll sparsely
+    _POLL_INITIAL_DELAY = 0.3
+    _POLL_MAX_DELAY = 3.0
+
+    # Suggestion categories eligible under each application mode
+    _GRAMMAR_CATEGORIES = frozenset({'grammar', 'spelling', 'punctuation'})
+    _STYLE_CATEGORIES = frozenset({'style', 'readability', 'overused'})
+
+    # Inputs shorter than this (after stripping) skip the API entirely:
+    # no meaningful analysis happens on a word or less
+    MIN_ANALYZE_LEN = 3
+
+    def __init__(self, api_key: Optional[str] = None, cache_size: int = 256):
         self.api_key = api_key
         self.base_url = "https://api.prowritingaid.com"
-        self.session = requests.Session()
-        
-        # Set up authentication headers if API key is provided
-        if self.api_key:
-            self.session.headers.update({
-                'Authorization': f'Bearer {self.api_key}',
-                'Content-Type': 'application/json'
-            })
+        # Session is built on first use: constructing urllib3 pools isn't
+        # free, and instances without a key never touch the network
+        self._session = None
+        # LRU of successful analyses keyed by text digest + reports, so
+        # re-analyzing an unchanged paragraph skips the submit/poll round
+        # trips entirely; cache_size=0 disables
+        self._cache_max = cache_size
+        self._cache = OrderedDict()
+        self._cache_lock = Lock()
+
+    @property
+    def session(self) -> requests.Session:
+        """Lazily-built keep-alive session with the tuned adapter."""
+        if self._session is None:
+            session = requests.Session()
+            # pool_maxsize covers concurrent analyze/poll callers so they
+            # keep reusing the same TLS connections. Transient transport
+            # failures and retryable statuses are handled entirely inside
+            # urllib3 (with jittered backoff and Retry-After support), so
+            # the polling loop only deals with application state
+            session.mount('https://', HTTPAdapter(
+                pool_connections=4,
+                pool_maxsize=32,
+                max_retries=Retry(total=5, connect=3, read=3, status=3,
+                                  backoff_factor=0.3, backoff_jitter=0.2,
+                                  status_forcelist=(429, 500, 502, 503, 504),
+                                  allowed_methods=frozenset(('GET', 'POST')))
+            ))
+            # The result endpoint is polled repeatedly against one host,
+            # so ask for keep-alive, and let the upstream compress the
+            # result JSON on the wire
+            session.headers['Connection'] = 'keep-alive'
+            session.headers['Accept-Encoding'] = 'gzip, br'
+
+            # Set up authentication headers if API key is provided
+            if self.api_key:
+                session.headers.update({
+                    'Authorization': f'Bearer {self.api_key}',
+                    'Content-Type': 'application/json'
+                })
+            self._session = session
+        return self._session
     
     def check_text_async(self, text: str, reports: List[str] = None) -> Dict:
         """
@@ -49,15 +115,18 @@ class ProWritingAidService:
                 'suggestions': True
             }
             
-            # Submit text for analysis
+            # Submit text for analysis; pre-encoded body skips the
+            # stdlib encoder (and its ensure-ascii escaping) requests
+            # would run for json=, and the session header already
+            # declares application/json
             response = self.session.post(
                 f'{self.base_url}/api/async/text',
-                json=data,
+                data=_json_dumps(data),
                 timeout=30
             )
             
             if response.status_code == 200:
-                result = response.json()
+                result = _json_loads(response.content)
                 return {
                     'task_id': result.get('taskId'),
                     'status': 'submitted',
@@ -80,14 +149,14 @@ class ProWritingAidService:
                 'task_id': None
             }
     
-    def get_analysis_result(self, task_id: str, max_retries: int = 10) -> Dict:
+    def get_analysis_result(self, task_id: str, timeout: float = 60.0) -> Dict:
         """
         Retrieve analysis results using task ID
-        
+
         Args:
             task_id: Task ID from async submission
-            max_retries: Maximum number of retry attempts
-            
+            timeout: Total polling deadline in seconds
+
         Returns:
             Dictionary containing analysis results
         """
@@ -96,21 +165,40 @@ class ProWritingAidService:
                 'error': 'ProWritingAid API key not configured or invalid task ID',
                 'result': None
             }
-        
-        for attempt in range(max_retries):
+
+        deadline = time.monotonic() + timeout
+        delay = self._POLL_INITIAL_DELAY
+        etag = None
+
+        while True:
             try:
                 response = self.session.get(
                     f'{self.base_url}/api/async/text/result/{task_id}',
+                    # Conditional poll: a 304 costs headers only instead
+                    # of the full "still processing" body each round
+                    headers={'If-None-Match': etag} if etag else None,
                     timeout=30
                 )
-                
-                if response.status_code == 200:
-                    result = response.json()
-                    
+
+                if response.status_code == 304:
+                    # Unchanged since the last poll — nothing to parse,
+                    # just back off and ask again
+                    pass
+
+                elif response.status_code == 200:
+                    etag = response.headers.get('ETag')
+                    result = _json_loads(response.content)
+
                     # Check if processing is complete
                     if result.get('status') == 'Done':
+                        payload = result.get('result')
+                        # The echoed input is only ever consumed for its
+                        # length; keep that and drop the full copy so
+                        # cached/returned results stay small
+                        if isinstance(payload, dict) and 'text' in payload:
+                            payload['text_length'] = len(payload.pop('text') or '')
                         return {
-                            'result': result.get('result'),
+                            'result': payload,
                             'status': 'complete',
                             'error': None
                         }
@@ -120,10 +208,15 @@ class ProWritingAidService:
                             'result': None
                         }
                     else:
-                        # Still processing, wait and retry
-                        time.sleep(2)
-                        continue
-                        
+                        # Still processing: honor a server-provided pace
+                        # if it asks for one, otherwise back off
+                        retry_after = response.headers.get('Retry-After')
+                        if retry_after:
+                            try:
+                                delay = max(delay, float(retry_after))
+                            except ValueError:
+                                pass  # Date-formatted Retry-After
+
                 elif response.status_code == 404:
                     return {
                         'error': 'Task not found or expired',
@@ -134,16 +227,21 @@ class ProWritingAidService:
                         'error': f'ProWritingAid API error: {response.status_code}',
                         'result': None
                     }
-                    
+
             except requests.exceptions.RequestException as e:
-                if attempt == max_retries - 1:
-                    return {
-                        'error': f'ProWritingAid request failed: {str(e)}',
-                        'result': None
-                    }
-                time.sleep(2)
-                continue
-        
+                # The adapter's Retry already exhausted its transport
+                # retries before this surfaces — don't re-poll on top
+                return {
+                    'error': f'ProWritingAid request failed: {str(e)}',
+                    'result': None
+                }
+
+            # Sleep only if another poll still fits inside the deadline
+            if time.monotonic() + delay >= deadline:
+                break
+            time.sleep(delay)
+            delay = min(self._POLL_MAX_DELAY, delay * 1.5)
+
         return {
             'error': 'ProWritingAid analysis timed out',
             'result': None
@@ -160,23 +258,156 @@ class ProWritingAidService:
         Returns:
             Dictionary containing analysis results
         """
+        # Degenerate inputs get an empty analysis without the submit and
+        # poll cycle; enhance_text_quality inherits the skip through here
+        stripped = text.strip()
+        if len(stripped) < self.MIN_ANALYZE_LEN:
+            return {
+                'result': {'Tags': [], 'text_length': len(stripped)},
+                'status': 'complete',
+                'error': None
+            }
+
+        cache_key = None
+        if self._cache_max:
+            cache_key = (hashlib.blake2b(text.encode(), digest_size=16).digest(),
+                         tuple(sorted(reports)) if reports else None)
+            with self._cache_lock:
+                cached = self._cache.get(cache_key)
+                if cached is not None:
+                    self._cache.move_to_end(cache_key)
+                    # Shallow copy so callers mutating the top level
+                    # don't poison the cached entry
+                    return dict(cached)
+
         # Submit for analysis
         submission = self.check_text_async(text, reports)
-        
+
         if submission.get('error'):
             return submission
-        
+
         task_id = submission.get('task_id')
         if not task_id:
             return {
                 'error': 'Failed to get task ID from ProWritingAid',
                 'result': None
             }
-        
+
         # Wait for and retrieve results
-        return self.get_analysis_result(task_id)
+        analysis = self.get_analysis_result(task_id)
+
+        # Only completed analyses are worth memoizing
+        if cache_key is not None and not analysis.get('error'):
+            with self._cache_lock:
+                self._cache[cache_key] = analysis
+                self._cache.move_to_end(cache_key)
+                while len(self._cache) > self._cache_max:
+                    self._cache.popitem(last=False)
+
+        return analysis
     
-    def apply_suggestions(self, text: str, suggestions: List[Dict], 
+    def analyze_texts_sync(self, texts: List[str], reports: List[str] = None) -> List[Dict]:
+        """
+        Analyze several texts with a single submission
+
+        The texts are joined with a record-separator sentinel, analyzed
+        as one document, and the returned tags are mapped back to
+        per-text coordinates by offset — K paragraphs cost one
+        submit/poll cycle instead of K.
+
+        Args:
+            texts: Texts to analyze
+            reports: List of report types to generate
+
+        Returns:
+            One result dictionary per input text, in input order
+        """
+        if not texts:
+            return []
+        if len(texts) == 1:
+            return [self.analyze_text_sync(texts[0], reports)]
+
+        analysis = self.analyze_text_sync(_BATCH_SEP.join(texts), reports)
+        if analysis.get('error'):
+            return [dict(analysis) for _ in texts]
+
+        # Start offset of each text within the joined payload
+        sep_len = len(_BATCH_SEP)
+        starts = [0]
+        for text in texts[:-1]:
+            starts.append(starts[-1] + len(text) + sep_len)
+
+        result = analysis.get('result') or {}
+        per_text_tags = [[] for _ in texts]
+        for tag in result.get('Tags', []):
+            start_pos = tag.get('startPos', 0)
+            end_pos = tag.get('endPos', start_pos)
+            slot = bisect_right(starts, start_pos) - 1
+            base = starts[slot]
+            # Drop tags that straddle a separator boundary — they can
+            # only be artifacts of the joining
+            if end_pos > base + len(texts[slot]):
+                continue
+            remapped = dict(tag)
+            remapped['startPos'] = start_pos - base
+            remapped['endPos'] = end_pos - base
+            per_text_tags[slot].append(remapped)
+
+        return [
+            {
+                'result': {'text': text, 'Tags': tags},
+                'status': 'complete',
+                'error': None
+            }
+            for text, tags in zip(texts, per_text_tags)
+        ]
+
+    @staticmethod
+    def _index_tags(tags: List[Dict]) -> tuple:
+        """
+        Extract tag fields into parallel lists in one pass
+
+        Dict hashing and default handling happen once per tag here; the
+        scans in apply_suggestions and get_writing_score then run over
+        plain lists. Only the first replacement survives (None when a
+        tag offers none), so the rest of each suggestion list can be
+        collected early.
+        """
+        starts = []
+        ends = []
+        cats = []
+        reps = []
+        for tag in tags:
+            tget = tag.get
+            start = tget('startPos', 0)
+            starts.append(start)
+            ends.append(tget('endPos', start))
+            cats.append((tget('category') or '').lower())
+            replacements = tget('suggestions')
+            reps.append(replacements[0] if replacements else None)
+        return starts, ends, cats, reps
+
+    def analyze_many(self, texts: List[str], max_workers: int = 8) -> List[Dict]:
+        """
+        Analyze several texts concurrently over the pooled session
+
+        Args:
+            texts: Texts to analyze
+            max_workers: Maximum in-flight analyses (kept within the
+                adapter's connection pool)
+
+        Returns:
+            Result dicts in the same order as the input texts
+        """
+        if not texts:
+            return []
+
+        # Each worker runs the full submit + poll cycle for its text, so
+        # the poll waits of independent jobs overlap instead of summing
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(texts))) as pool:
+            return list(pool.map(self.analyze_text_sync, texts))
+
+    def apply_suggestions(self, text: str, suggestions: List[Dict],
                          apply_grammar: bool = True, apply_style: bool = False) -> str:
         """
         Apply ProWritingAid suggestions to text
@@ -192,48 +423,48 @@ class ProWritingAidService:
         """
         if not suggestions:
             return text
-        
-        # Sort suggestions by start position in reverse order
-        sorted_suggestions = sorted(
-            suggestions, 
-            key=lambda x: x.get('startPos', 0), 
-            reverse=True
-        )
-        
-        corrected_text = text
-        
-        for suggestion in sorted_suggestions:
-            try:
-                start_pos = suggestion.get('startPos', 0)
-                end_pos = suggestion.get('endPos', start_pos)
-                replacements = suggestion.get('suggestions', [])
-                category = suggestion.get('category', '').lower()
-                
-                # Skip if no replacements
-                if not replacements:
-                    continue
-                
-                # Apply based on category and settings
-                should_apply = False
-                if apply_grammar and category in ['grammar', 'spelling', 'punctuation']:
-                    should_apply = True
-                elif apply_style and category in ['style', 'readability', 'overused']:
-                    should_apply = True
-                
-                if should_apply and replacements:
-                    # Use the first (best) suggestion
-                    replacement = replacements[0]
-                    corrected_text = (
-                        corrected_text[:start_pos] + 
-                        replacement + 
-                        corrected_text[end_pos:]
-                    )
-                    
-            except (KeyError, IndexError, TypeError):
-                # Skip malformed suggestions
+
+        # Union of the category sets the caller enabled, built once so
+        # the loop does a single membership test per suggestion
+        allowed = frozenset()
+        if apply_grammar:
+            allowed |= self._GRAMMAR_CATEGORIES
+        if apply_style:
+            allowed |= self._STYLE_CATEGORIES
+        if not allowed:
+            return text
+
+        # Walk the suggestions in position order and splice the result
+        # together once at the end: repeated full-string slicing copied
+        # the whole text per applied suggestion
+        starts, ends, cats, reps = self._index_tags(suggestions)
+
+        parts = []
+        parts_append = parts.append
+        pos = 0
+
+        for i in sorted(range(len(starts)), key=starts.__getitem__):
+            # Skip if no replacements
+            replacement = reps[i]
+            if replacement is None:
                 continue
-        
-        return corrected_text
+
+            # Apply based on category and settings
+            if cats[i] not in allowed:
+                continue
+
+            # Skip suggestions overlapping one already applied
+            start_pos = starts[i]
+            if start_pos < pos:
+                continue
+
+            # Use the first (best) suggestion
+            parts_append(text[pos:start_pos])
+            parts_append(replacement)
+            pos = ends[i]
+
+        parts_append(text[pos:])
+        return ''.join(parts)
     
     def get_writing_score(self, analysis_result: Dict) -> Dict:
         """
@@ -264,22 +495,24 @@ class ProWritingAidService:
             'issues_found': 0
         }
         
-        # Count issues by category
+        # Count issues by category over the flat field list
         tags = result.get('Tags', [])
+        _, _, cats, _ = self._index_tags(tags)
         grammar_issues = 0
         style_issues = 0
-        
-        for tag in tags:
-            category = tag.get('category', '').lower()
-            if category in ['grammar', 'spelling', 'punctuation']:
+
+        for category in cats:
+            if category in self._GRAMMAR_CATEGORIES:
                 grammar_issues += 1
-            elif category in ['style', 'readability', 'overused']:
+            elif category in self._STYLE_CATEGORIES:
                 style_issues += 1
         
         scores['issues_found'] = len(tags)
         
         # Calculate simple scores (higher is better, 0-100 scale)
-        text_length = len(result.get('text', ''))
+        text_length = result.get('text_length')
+        if text_length is None:
+            text_length = len(result.get('text', ''))
         if text_length > 0:
             # Grammar score: fewer grammar issues = higher score
             scores['grammar_score'] = max(0, 100 - (grammar_issues * 10))
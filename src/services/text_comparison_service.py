@@ -2,18 +2,157 @@
 Text Comparison Service
 Provides detailed comparison between original and humanized texts.
 """
+import hashlib
 import re
 import difflib
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from threading import Lock
 from typing import Dict, List, Any, Tuple
 import logging
 
+try:
+    from rapidfuzz import fuzz, process
+except ImportError:  # rapidfuzz is optional; difflib remains the fallback
+    fuzz = None
+    process = None
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 logger = logging.getLogger(__name__)
 
+# Analytics service used for readability comparisons. Imported lazily so
+# a failure there surfaces through _compare_readability's error path
+# rather than blocking this module, and constructed once because the
+# instance carries its own result cache.
+_analytics = None
+
+def _get_analytics():
+    """Process-level TextAnalyticsService singleton."""
+    global _analytics
+    if _analytics is None:
+        from .text_analytics_service import TextAnalyticsService
+        _analytics = TextAnalyticsService()
+    return _analytics
+
+# Maps the three sentence terminators to one sentinel so sentence
+# splitting is a translate + split instead of a regex pass
+_SENT_TRANS = str.maketrans('.!?', '\x00\x00\x00')
+
+def _split_sentences(text: str) -> List[str]:
+    """Non-empty, stripped sentence fragments of the text."""
+    return [s.strip() for s in text.translate(_SENT_TRANS).split('\x00') if s.strip()]
+
+def _complex_word_count(freq: Counter) -> int:
+    """Total occurrences of words longer than six characters."""
+    if np is not None:
+        lens = np.fromiter(map(len, freq.keys()), dtype=np.int64, count=len(freq))
+        counts = np.fromiter(freq.values(), dtype=np.int64, count=len(freq))
+        return int(counts[lens > 6].sum())
+    return sum(count for word, count in freq.items() if len(word) > 6)
+
+def _length_stats(lengths: List[int]) -> Tuple[int, int, float]:
+    """(min, max, mean) of a length list; zeros when the list is empty."""
+    if not lengths:
+        return 0, 0, 0
+    if np is not None:
+        arr = np.fromiter(lengths, dtype=np.int64, count=len(lengths))
+        return int(arr.min()), int(arr.max()), float(arr.mean())
+    return min(lengths), max(lengths), sum(lengths) / len(lengths)
+
+# Above this combined length the pure-Python quadratic ratio starts to
+# dominate a comparison; fall back to a linear shingle estimate instead
+_SHINGLE_THRESHOLD = 4000
+_SHINGLE_K = 5
+
+def _shingle_similarity(a: str, b: str) -> float:
+    """Jaccard similarity over hashed k-character shingles.
+
+    Linear-time approximation of the character-level ratio for inputs
+    too long to run through the exact matcher.
+    """
+    if a == b:
+        return 1.0
+    a_shingles = {hash(a[i:i + _SHINGLE_K]) for i in range(max(len(a) - _SHINGLE_K + 1, 1))}
+    b_shingles = {hash(b[i:i + _SHINGLE_K]) for i in range(max(len(b) - _SHINGLE_K + 1, 1))}
+    union = len(a_shingles | b_shingles)
+    return len(a_shingles & b_shingles) / union if union else 0.0
+
+def _strip_common_affixes(a, b):
+    """Split off the common prefix and suffix of two sequences.
+
+    Humanized text usually shares long unchanged runs with the original;
+    removing them up front shrinks what the quadratic matcher sees.
+    Returns (a_middle, b_middle, shared_length), where shared_length is
+    the combined prefix + suffix length. The equal-prefix predicate is
+    monotone, so both bounds binary-search over C-level slice compares.
+    """
+    limit = min(len(a), len(b))
+    lo, hi = 0, limit
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if a[:mid] == b[:mid]:
+            lo = mid
+        else:
+            hi = mid - 1
+    prefix = lo
+
+    lo, hi = 0, limit - prefix
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if a[len(a) - mid:] == b[len(b) - mid:]:
+            lo = mid
+        else:
+            hi = mid - 1
+    suffix = lo
+
+    return a[prefix:len(a) - suffix], b[prefix:len(b) - suffix], prefix + suffix
+
+# Compiled once at import; every comparison reuses these
+_WORD_RE = re.compile(r'\b\w+\b')
+_WS_RE = re.compile(r'\s+')
+_SENT_SPLIT_RE = re.compile(r'[.!?]+')
+_PUNCT_RE = re.compile(r'[.!?;:,\-—()\[\]{}"]')
+# Both conjunction classes in one alternation: each sentence is scanned
+# once and the matched group tells the class apart
+_CONJ_RE = re.compile(
+    r'\b(?P<coord>and|but|or|so|yet)\b'
+    r'|\b(?P<subord>because|since|although|while|if|when|that|which)\b',
+    re.IGNORECASE)
+
+# One alternation finds every transition word in a single scan instead of
+# one whole-text pass per word
+_TRANSITION_WORDS = (
+    'however', 'furthermore', 'moreover', 'additionally', 'consequently',
+    'therefore', 'subsequently', 'nevertheless', 'nonetheless', 'accordingly',
+    'meanwhile', 'finally', 'ultimately', 'specifically', 'particularly'
+)
+_TRANS_RE = re.compile(r'\b(' + '|'.join(_TRANSITION_WORDS) + r')\b', re.IGNORECASE)
+
 class TextComparisonService:
     """Service for comparing original and humanized texts with detailed analysis."""
-    
+
+    # Bound on the memoized comparison results
+    _CACHE_MAX = 128
+
     def __init__(self):
-        pass
+        # Shared pool so compare_texts can overlap its independent
+        # sub-analyses without paying thread spawn per call; the
+        # fuzzy-matching and NumPy sections release the GIL
+        self._pool = ThreadPoolExecutor(max_workers=6)
+        # LRU of comparison results keyed by the digests of both texts:
+        # report re-renders and page refreshes resubmit identical pairs
+        self._cache = OrderedDict()
+        self._cache_lock = Lock()
+
+    def clear_cache(self) -> None:
+        """Drop all memoized comparison results."""
+        with self._cache_lock:
+            self._cache.clear()
 
     def compare_texts(self, original: str, humanized: str) -> Dict[str, Any]:
         """
@@ -26,31 +165,61 @@ class TextComparisonService:
         Returns:
             Dict containing detailed comparison results
         """
+        cache_key = (hashlib.blake2b(original.encode(), digest_size=16).digest(),
+                     hashlib.blake2b(humanized.encode(), digest_size=16).digest())
+        with self._cache_lock:
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                self._cache.move_to_end(cache_key)
+                # Shallow copy so callers mutating the top level don't
+                # poison the cached entry
+                return dict(cached)
+
         try:
-            # Basic statistics comparison
-            basic_comparison = self._compare_basic_stats(original, humanized)
-            
-            # Word-level changes
-            word_changes = self._analyze_word_changes(original, humanized)
-            
-            # Sentence-level changes
-            sentence_changes = self._analyze_sentence_changes(original, humanized)
-            
-            # Structural changes
-            structural_changes = self._analyze_structural_changes(original, humanized)
-            
-            # Readability comparison
-            readability_comparison = self._compare_readability(original, humanized)
-            
-            # Similarity metrics
-            similarity_metrics = self._calculate_similarity_metrics(original, humanized)
-            
+            # The six sub-analyses are independent of one another, so they
+            # run concurrently on the shared pool; only the change summary
+            # needs the gathered results
+            # Several analyses need the same tokenizations; compute the
+            # sentence fragments and lowercased word lists once per text
+            original_sentences = _split_sentences(original)
+            humanized_sentences = _split_sentences(humanized)
+            original_words = _WORD_RE.findall(original.lower())
+            humanized_words = _WORD_RE.findall(humanized.lower())
+            # One tabulation per text serves both the word-change analysis
+            # and the Jaccard metric; Counter hashes every token exactly once
+            original_freq = Counter(original_words)
+            humanized_freq = Counter(humanized_words)
+
+            basic_future = self._pool.submit(
+                self._compare_basic_stats, original, humanized,
+                original_words, humanized_words)
+            word_future = self._pool.submit(
+                self._analyze_word_changes, original, humanized,
+                original_freq, humanized_freq)
+            sentence_future = self._pool.submit(
+                self._analyze_sentence_changes, original, humanized,
+                original_sentences, humanized_sentences)
+            structural_future = self._pool.submit(self._analyze_structural_changes, original, humanized)
+            readability_future = self._pool.submit(self._compare_readability, original, humanized)
+            similarity_future = self._pool.submit(
+                self._calculate_similarity_metrics, original, humanized,
+                original_sentences, humanized_sentences,
+                original_words, humanized_words,
+                original_freq, humanized_freq)
+
+            basic_comparison = basic_future.result()
+            word_changes = word_future.result()
+            sentence_changes = sentence_future.result()
+            structural_changes = structural_future.result()
+            readability_comparison = readability_future.result()
+            similarity_metrics = similarity_future.result()
+
             # Change summary
             change_summary = self._generate_change_summary(
                 word_changes, sentence_changes, structural_changes
             )
             
-            return {
+            result = {
                 'success': True,
                 'basic_comparison': basic_comparison,
                 'word_changes': word_changes,
@@ -60,6 +229,14 @@ class TextComparisonService:
                 'similarity_metrics': similarity_metrics,
                 'change_summary': change_summary
             }
+
+            # Only successful comparisons are worth memoizing
+            with self._cache_lock:
+                self._cache[cache_key] = result
+                self._cache.move_to_end(cache_key)
+                while len(self._cache) > self._CACHE_MAX:
+                    self._cache.popitem(last=False)
+            return dict(result)
             
         except Exception as e:
             logger.error(f"Text comparison error: {str(e)}")
@@ -68,10 +245,12 @@ class TextComparisonService:
                 'error': f"Text comparison failed: {str(e)}"
             }
 
-    def _compare_basic_stats(self, original: str, humanized: str) -> Dict[str, Any]:
+    def _compare_basic_stats(self, original: str, humanized: str,
+                             original_words: List[str] = None,
+                             humanized_words: List[str] = None) -> Dict[str, Any]:
         """Compare basic statistics between texts."""
-        original_stats = self._get_text_stats(original)
-        humanized_stats = self._get_text_stats(humanized)
+        original_stats = self._get_text_stats(original, original_words)
+        humanized_stats = self._get_text_stats(humanized, humanized_words)
         
         return {
             'original': original_stats,
@@ -89,91 +268,102 @@ class TextComparisonService:
             }
         }
 
-    def _analyze_word_changes(self, original: str, humanized: str) -> Dict[str, Any]:
+    def _analyze_word_changes(self, original: str, humanized: str,
+                              original_freq: Counter = None,
+                              humanized_freq: Counter = None) -> Dict[str, Any]:
         """Analyze word-level changes between texts."""
-        original_words = re.findall(r'\b\w+\b', original.lower())
-        humanized_words = re.findall(r'\b\w+\b', humanized.lower())
-        
-        # Find added, removed, and changed words
-        original_set = set(original_words)
-        humanized_set = set(humanized_words)
-        
-        added_words = list(humanized_set - original_set)
-        removed_words = list(original_set - humanized_set)
-        common_words = list(original_set & humanized_set)
-        
-        # Word frequency changes
-        original_freq = {}
-        humanized_freq = {}
-        
-        for word in original_words:
-            original_freq[word] = original_freq.get(word, 0) + 1
-        
-        for word in humanized_words:
-            humanized_freq[word] = humanized_freq.get(word, 0) + 1
-        
-        frequency_changes = {}
-        for word in common_words:
-            orig_count = original_freq.get(word, 0)
-            human_count = humanized_freq.get(word, 0)
-            if orig_count != human_count:
-                frequency_changes[word] = {
-                    'original_count': orig_count,
-                    'humanized_count': human_count,
-                    'change': human_count - orig_count
-                }
-        
-        # Vocabulary complexity changes
-        original_complex = [w for w in original_words if len(w) > 6]
-        humanized_complex = [w for w in humanized_words if len(w) > 6]
-        
-        complexity_change = len(humanized_complex) - len(original_complex)
+        # One tabulation pass per text covers membership and frequencies
+        if original_freq is None:
+            original_freq = Counter(_WORD_RE.findall(original.lower()))
+        if humanized_freq is None:
+            humanized_freq = Counter(_WORD_RE.findall(humanized.lower()))
+
+        added_words = humanized_freq.keys() - original_freq.keys()
+        removed_words = original_freq.keys() - humanized_freq.keys()
+        common_words = original_freq.keys() & humanized_freq.keys()
+
+        # Only the first 10 changes are reported, so stop building there
+        frequency_changes = dict(islice(
+            (
+                (word, {
+                    'original_count': original_freq[word],
+                    'humanized_count': humanized_freq[word],
+                    'change': humanized_freq[word] - original_freq[word]
+                })
+                for word in common_words
+                if original_freq[word] != humanized_freq[word]
+            ),
+            10))
+
+        # Vocabulary complexity changes, counted over unique words
+        original_complex_count = _complex_word_count(original_freq)
+        humanized_complex_count = _complex_word_count(humanized_freq)
+
+        complexity_change = humanized_complex_count - original_complex_count
         
         return {
-            'added_words': added_words[:20],  # Limit to first 20
-            'removed_words': removed_words[:20],
+            'added_words': list(islice(added_words, 20)),  # Limit to first 20
+            'removed_words': list(islice(removed_words, 20)),
             'added_count': len(added_words),
             'removed_count': len(removed_words),
             'common_words_count': len(common_words),
-            'frequency_changes': dict(list(frequency_changes.items())[:10]),  # Top 10 changes
+            'frequency_changes': frequency_changes,  # Top 10 changes
             'vocabulary_complexity': {
-                'original_complex_words': len(original_complex),
-                'humanized_complex_words': len(humanized_complex),
+                'original_complex_words': original_complex_count,
+                'humanized_complex_words': humanized_complex_count,
                 'complexity_change': complexity_change
             }
         }
 
-    def _analyze_sentence_changes(self, original: str, humanized: str) -> Dict[str, Any]:
+    def _analyze_sentence_changes(self, original: str, humanized: str,
+                                  original_sentences: List[str] = None,
+                                  humanized_sentences: List[str] = None) -> Dict[str, Any]:
         """Analyze sentence-level changes between texts."""
-        original_sentences = re.split(r'[.!?]+', original)
-        humanized_sentences = re.split(r'[.!?]+', humanized)
-        
-        original_sentences = [s.strip() for s in original_sentences if s.strip()]
-        humanized_sentences = [s.strip() for s in humanized_sentences if s.strip()]
-        
-        # Sentence length analysis
-        original_lengths = [len(s.split()) for s in original_sentences]
-        humanized_lengths = [len(s.split()) for s in humanized_sentences]
-        
-        avg_original_length = sum(original_lengths) / len(original_lengths) if original_lengths else 0
-        avg_humanized_length = sum(humanized_lengths) / len(humanized_lengths) if humanized_lengths else 0
+        if original_sentences is None:
+            original_sentences = _split_sentences(original)
+        if humanized_sentences is None:
+            humanized_sentences = _split_sentences(humanized)
+
+        # Sentence length analysis; min/max/mean fold into one reduction.
+        # Counting whitespace runs matches len(s.split()) on the stripped,
+        # non-empty fragments without allocating a word list per sentence
+        original_lengths = [len(_WS_RE.findall(s)) + 1 for s in original_sentences]
+        humanized_lengths = [len(_WS_RE.findall(s)) + 1 for s in humanized_sentences]
+
+        original_min, original_max, avg_original_length = _length_stats(original_lengths)
+        humanized_min, humanized_max, avg_humanized_length = _length_stats(humanized_lengths)
         
         # Sentence structure changes
         original_structures = self._analyze_sentence_structures(original_sentences)
         humanized_structures = self._analyze_sentence_structures(humanized_sentences)
         
-        # Find similar sentences using difflib
+        # Find similar sentences; rapidfuzz batches the candidate scan in
+        # C++ where available, difflib remains the fallback
         sentence_matches = []
+        humanized_set = set(humanized_sentences)
         for i, orig_sent in enumerate(original_sentences[:10]):  # Limit to first 10
-            best_match = difflib.get_close_matches(orig_sent, humanized_sentences, n=1, cutoff=0.6)
-            if best_match:
-                similarity = difflib.SequenceMatcher(None, orig_sent, best_match[0]).ratio()
-                sentence_matches.append({
-                    'original_index': i,
-                    'original_sentence': orig_sent,
-                    'matched_sentence': best_match[0],
-                    'similarity': round(similarity, 3)
-                })
+            if orig_sent in humanized_set:
+                # Unchanged sentence; no fuzzy scan needed
+                matched_sentence, similarity = orig_sent, 1.0
+            elif process is not None:
+                match = process.extractOne(orig_sent, humanized_sentences,
+                                           scorer=fuzz.ratio, score_cutoff=60)
+                if match:
+                    matched_sentence, similarity = match[0], match[1] / 100.0
+                else:
+                    continue
+            else:
+                best_match = difflib.get_close_matches(orig_sent, humanized_sentences, n=1, cutoff=0.6)
+                if not best_match:
+                    continue
+                matched_sentence = best_match[0]
+                similarity = difflib.SequenceMatcher(None, orig_sent, matched_sentence).ratio()
+            sentence_matches.append({
+                'original_index': i,
+                'original_sentence': orig_sent,
+                'matched_sentence': matched_sentence,
+                'similarity': round(similarity, 3)
+            })
         
         return {
             'sentence_count_change': len(humanized_sentences) - len(original_sentences),
@@ -183,13 +373,13 @@ class TextComparisonService:
             'sentence_matches': sentence_matches,
             'length_distribution': {
                 'original': {
-                    'min': min(original_lengths) if original_lengths else 0,
-                    'max': max(original_lengths) if original_lengths else 0,
+                    'min': original_min,
+                    'max': original_max,
                     'avg': round(avg_original_length, 2)
                 },
                 'humanized': {
-                    'min': min(humanized_lengths) if humanized_lengths else 0,
-                    'max': max(humanized_lengths) if humanized_lengths else 0,
+                    'min': humanized_min,
+                    'max': humanized_max,
                     'avg': round(avg_humanized_length, 2)
                 }
             }
@@ -198,15 +388,13 @@ class TextComparisonService:
     def _analyze_structural_changes(self, original: str, humanized: str) -> Dict[str, Any]:
         """Analyze structural changes between texts."""
         # Punctuation analysis
-        original_punct = re.findall(r'[.!?;:,\-—()[\]{}"]', original)
-        humanized_punct = re.findall(r'[.!?;:,\-—()[\]{}"]', humanized)
-        
+        original_punct = Counter(_PUNCT_RE.findall(original))
+        humanized_punct = Counter(_PUNCT_RE.findall(humanized))
+
         punct_changes = {}
-        all_punct = set(original_punct + humanized_punct)
-        
-        for punct in all_punct:
-            orig_count = original_punct.count(punct)
-            human_count = humanized_punct.count(punct)
+        for punct in original_punct.keys() | humanized_punct.keys():
+            orig_count = original_punct[punct]
+            human_count = humanized_punct[punct]
             if orig_count != human_count:
                 punct_changes[punct] = {
                     'original': orig_count,
@@ -214,27 +402,25 @@ class TextComparisonService:
                     'change': human_count - orig_count
                 }
         
-        # Transition word analysis
-        transition_words = [
-            'however', 'furthermore', 'moreover', 'additionally', 'consequently',
-            'therefore', 'subsequently', 'nevertheless', 'nonetheless', 'accordingly',
-            'meanwhile', 'finally', 'ultimately', 'specifically', 'particularly'
-        ]
-        
+        # Transition word analysis: one alternation scan per text, then
+        # per-word counts off the match tallies
+        original_counts = Counter(match.lower() for match in _TRANS_RE.findall(original))
+        humanized_counts = Counter(match.lower() for match in _TRANS_RE.findall(humanized))
+
         original_transitions = []
         humanized_transitions = []
-        
-        for word in transition_words:
-            orig_count = len(re.findall(rf'\b{word}\b', original, re.IGNORECASE))
-            human_count = len(re.findall(rf'\b{word}\b', humanized, re.IGNORECASE))
-            
+
+        for word in _TRANSITION_WORDS:
+            orig_count = original_counts.get(word, 0)
+            human_count = humanized_counts.get(word, 0)
+
             if orig_count > 0 or human_count > 0:
                 original_transitions.append((word, orig_count))
                 humanized_transitions.append((word, human_count))
         
-        # Paragraph structure
-        original_paragraphs = len(original.split('\n\n'))
-        humanized_paragraphs = len(humanized.split('\n\n'))
+        # Paragraph structure; counting separators avoids splitting
+        original_paragraphs = original.count('\n\n') + 1
+        humanized_paragraphs = humanized.count('\n\n') + 1
         
         return {
             'punctuation_changes': punct_changes,
@@ -253,13 +439,11 @@ class TextComparisonService:
     def _compare_readability(self, original: str, humanized: str) -> Dict[str, Any]:
         """Compare readability metrics between texts."""
         try:
-            # Import text analytics service for readability calculation
-            from .text_analytics_service import TextAnalyticsService
-            
-            analytics = TextAnalyticsService()
-            
-            original_analysis = analytics.analyze_text(original)
-            humanized_analysis = analytics.analyze_text(humanized)
+            analytics = _get_analytics()
+
+            # Both analyses are independent; analyze_batch overlaps them
+            original_analysis, humanized_analysis = analytics.analyze_batch(
+                [original, humanized], max_workers=2)
             
             if original_analysis['success'] and humanized_analysis['success']:
                 original_readability = original_analysis['readability']
@@ -287,32 +471,89 @@ class TextComparisonService:
             logger.error(f"Readability comparison error: {str(e)}")
             return {'error': f'Readability comparison failed: {str(e)}'}
 
-    def _calculate_similarity_metrics(self, original: str, humanized: str) -> Dict[str, Any]:
+    @staticmethod
+    def _sequence_similarity(a, b) -> float:
+        """Similarity ratio between two sequences (rapidfuzz when available)."""
+        if a == b:
+            # Equal inputs are common (no-op humanization, re-runs) and
+            # skip the quadratic matching entirely
+            return 1.0
+        if fuzz is not None:
+            # rapidfuzz already trims common affixes internally
+            return fuzz.ratio(a, b) / 100.0
+        # Run the quadratic matcher only on the differing middles and fold
+        # the stripped affixes back into the ratio
+        a_mid, b_mid, shared = _strip_common_affixes(a, b)
+        matched = (difflib.SequenceMatcher(None, a_mid, b_mid).ratio()
+                   * (len(a_mid) + len(b_mid)) / 2)
+        return 2 * (shared + matched) / (len(a) + len(b))
+
+    def _calculate_similarity_metrics(self, original: str, humanized: str,
+                                      original_sentences: List[str] = None,
+                                      humanized_sentences: List[str] = None,
+                                      original_words: List[str] = None,
+                                      humanized_words: List[str] = None,
+                                      original_freq: Counter = None,
+                                      humanized_freq: Counter = None) -> Dict[str, Any]:
         """Calculate various similarity metrics between texts."""
-        # Character-level similarity
-        char_similarity = difflib.SequenceMatcher(None, original, humanized).ratio()
-        
+        # Identical inputs: every metric is 1.0, skip all tokenization.
+        # The word-content check keeps degenerate word-free inputs on the
+        # normal path, where Jaccard reports 0 for an empty union.
+        if original == humanized and _WORD_RE.search(original):
+            return {
+                'character_similarity': 1.0,
+                'word_similarity': 1.0,
+                'sentence_similarity': 1.0,
+                'jaccard_similarity': 1.0,
+                'overall_similarity': 1.0
+            }
+
+        # Character-level similarity; long inputs take the shingle
+        # estimate when rapidfuzz is not around to run the exact ratio
+        # in C++ — the difflib fallback is quadratic at that size
+        if fuzz is None and len(original) + len(humanized) > _SHINGLE_THRESHOLD:
+            char_similarity = _shingle_similarity(original, humanized)
+        else:
+            char_similarity = self._sequence_similarity(original, humanized)
+
         # Word-level similarity
-        original_words = re.findall(r'\b\w+\b', original.lower())
-        humanized_words = re.findall(r'\b\w+\b', humanized.lower())
-        
-        word_similarity = difflib.SequenceMatcher(None, original_words, humanized_words).ratio()
-        
+        if original_words is None:
+            original_words = _WORD_RE.findall(original.lower())
+        if humanized_words is None:
+            humanized_words = _WORD_RE.findall(humanized.lower())
+
+        word_similarity = self._sequence_similarity(original_words, humanized_words)
+
         # Sentence-level similarity
-        original_sentences = re.split(r'[.!?]+', original)
-        humanized_sentences = re.split(r'[.!?]+', humanized)
-        
-        original_sentences = [s.strip() for s in original_sentences if s.strip()]
-        humanized_sentences = [s.strip() for s in humanized_sentences if s.strip()]
-        
-        sentence_similarity = difflib.SequenceMatcher(None, original_sentences, humanized_sentences).ratio()
-        
-        # Jaccard similarity (word sets)
-        original_set = set(original_words)
-        humanized_set = set(humanized_words)
-        
-        intersection = len(original_set & humanized_set)
-        union = len(original_set | humanized_set)
+        if original_sentences is None:
+            original_sentences = _split_sentences(original)
+        if humanized_sentences is None:
+            humanized_sentences = _split_sentences(humanized)
+
+        sentence_similarity = self._sequence_similarity(original_sentences, humanized_sentences)
+
+        # Jaccard similarity (word sets); the shared Counters already hold
+        # the unique words, so no token is hashed a second time
+        if original_freq is None:
+            original_freq = Counter(original_words)
+        if humanized_freq is None:
+            humanized_freq = Counter(humanized_words)
+        if np is not None:
+            # With NumPy the set algebra runs on hashed uint64 word IDs
+            # instead of Python set objects
+            original_ids = np.unique(np.fromiter(
+                (hash(t) & 0xFFFFFFFFFFFFFFFF for t in original_freq.keys()),
+                dtype=np.uint64, count=len(original_freq)
+            ))
+            humanized_ids = np.unique(np.fromiter(
+                (hash(t) & 0xFFFFFFFFFFFFFFFF for t in humanized_freq.keys()),
+                dtype=np.uint64, count=len(humanized_freq)
+            ))
+            intersection = len(np.intersect1d(original_ids, humanized_ids, assume_unique=True))
+            union = len(np.union1d(original_ids, humanized_ids))
+        else:
+            intersection = len(original_freq.keys() & humanized_freq.keys())
+            union = len(original_freq.keys() | humanized_freq.keys())
         jaccard_similarity = intersection / union if union > 0 else 0
         
         return {
@@ -365,14 +606,18 @@ class TextComparisonService:
             'preservation_score': round(100 - (total_word_changes + sentence_count_change + punct_changes), 2)
         }
 
-    def _get_text_stats(self, text: str) -> Dict[str, int]:
-        """Get basic statistics for a text."""
+    def _get_text_stats(self, text: str, words: List[str] = None) -> Dict[str, int]:
+        """Get basic statistics for a text.
+
+        A pre-tokenized word list can be passed in to skip the word scan;
+        the tokenizer is case-insensitive so the count is unaffected.
+        """
         return {
             'characters': len(text),
-            'characters_no_spaces': len(text.replace(' ', '')),
-            'words': len(re.findall(r'\b\w+\b', text)),
-            'sentences': len(re.split(r'[.!?]+', text)) - 1,  # -1 because split creates empty string at end
-            'paragraphs': len(text.split('\n\n'))
+            'characters_no_spaces': len(text) - text.count(' '),
+            'words': len(words) if words is not None else len(_WORD_RE.findall(text)),
+            'sentences': len(_SENT_SPLIT_RE.split(text)) - 1,  # -1 because split creates empty string at end
+            'paragraphs': text.count('\n\n') + 1
         }
 
     def _analyze_sentence_structures(self, sentences: List[str]) -> Dict[str, int]:
@@ -386,8 +631,13 @@ class TextComparisonService:
         
         for sentence in sentences:
             # Simple heuristics for sentence structure classification
-            coord_conjunctions = len(re.findall(r'\b(and|but|or|so|yet)\b', sentence, re.IGNORECASE))
-            subord_conjunctions = len(re.findall(r'\b(because|since|although|while|if|when|that|which)\b', sentence, re.IGNORECASE))
+            coord_conjunctions = 0
+            subord_conjunctions = 0
+            for match in _CONJ_RE.finditer(sentence):
+                if match.lastgroup == 'coord':
+                    coord_conjunctions += 1
+                else:
+                    subord_conjunctions += 1
             
             if coord_conjunctions > 0 and subord_conjunctions > 0:
                 structures['compound_complex'] += 1
@@ -0,0 +1,8 @@
+"""
+WSGI entry point for production servers.
+
+Run with: gunicorn -w 4 --preload --worker-class gthread --threads 8 wsgi:application
+"""
+from src.main import app
+
+application = app